@@ -2,15 +2,28 @@
 Execution history dialog for displaying task execution logs.
 """
 
+import bisect
+import json
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from src.models.execution import ExecutionLog
 from src.storage.log_storage import get_log_storage
 
 
+# Maximum number of message characters shown in the logs list
+MESSAGE_PREVIEW_LENGTH = 100
+
+# Number of rows rendered initially and added by each "Load More"
+LOG_PAGE_SIZE = 100
+
+# Shared encoder for the log detail view; non-serializable values fall back to str()
+_DETAILS_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, default=str)
+
+
 class ExecutionHistoryDialog:
     """Dialog for viewing task execution history."""
     
@@ -29,6 +42,13 @@ class ExecutionHistoryDialog:
         self.log_storage = get_log_storage()
         self.logs: List[ExecutionLog] = []
         self.filtered_logs: List[ExecutionLog] = []
+        self._message_strs: Dict[str, str] = {}
+        self._logs_by_id: Dict[str, ExecutionLog] = {}
+        self._neg_timestamps: List[float] = []
+        # Displayed row IDs and the time text each row currently shows
+        self._displayed_times: Dict[str, str] = {}
+        self._filtered_success_count = 0
+        self._visible_count = LOG_PAGE_SIZE
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
@@ -185,14 +205,18 @@ class ExecutionHistoryDialog:
         self.tree.column("message", width=500, anchor="w")
         
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(logs_frame, orient="vertical", command=self.tree.yview)
-        h_scrollbar = ttk.Scrollbar(logs_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.v_scrollbar = ttk.Scrollbar(logs_frame, orient="vertical", command=self.tree.yview)
+        self.h_scrollbar = ttk.Scrollbar(logs_frame, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(yscrollcommand=self.v_scrollbar.set, xscrollcommand=self.h_scrollbar.set)
         
         # Grid layout
         self.tree.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
-        h_scrollbar.grid(row=1, column=0, sticky="ew")
+        self.v_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.h_scrollbar.grid(row=1, column=0, sticky="ew")
+        
+        # Configure row colors
+        self.tree.tag_configure("success", foreground="#28A745")
+        self.tree.tag_configure("failed", foreground="#DC3545")
         
         # Bind double-click to show details
         self.tree.bind("<Double-1>", self._show_log_details)
@@ -225,13 +249,21 @@ class ExecutionHistoryDialog:
         )
         self.stats_label.pack(side=tk.LEFT)
         
+        # Load more button
+        self.load_more_button = ttk.Button(
+            button_frame,
+            text=f"Load More ({LOG_PAGE_SIZE})",
+            command=self._load_more
+        )
+        self.load_more_button.pack(side=tk.LEFT, padx=(10, 0))
+        
         # Export button
-        export_button = ttk.Button(
+        self.export_button = ttk.Button(
             button_frame,
             text="📤 Export",
             command=self._export_logs
         )
-        export_button.pack(side=tk.RIGHT, padx=(5, 0))
+        self.export_button.pack(side=tk.RIGHT, padx=(5, 0))
         
         # Close button
         close_button = ttk.Button(
@@ -248,25 +280,45 @@ class ExecutionHistoryDialog:
             filters = {"schedule_name": self.task_name}
             self.logs = self.log_storage.load_logs(0, 1000, filters)
             self.filtered_logs = self.logs.copy()
+            self._precompute_display_strings()
+            self._visible_count = LOG_PAGE_SIZE
+            self._clear_display()
             self._update_display()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load execution logs: {str(e)}")
     
+    def _precompute_display_strings(self) -> None:
+        """Precompute lookups, timestamps, success count and display strings at load time."""
+        message_strs = {}
+        success_count = 0
+        self._logs_by_id = {log.id: log for log in self.logs}
+        # Storage returns logs newest first, so negated timestamps are ascending
+        self._neg_timestamps = [-log.execution_time.timestamp() for log in self.logs]
+        for log in self.logs:
+            success_count += log.result.success
+            message = log.result.message
+            if len(message) > MESSAGE_PREVIEW_LENGTH:
+                message = message[:MESSAGE_PREVIEW_LENGTH] + "..."
+            message_strs[log.id] = message
+        self._message_strs = message_strs
+        self._filtered_success_count = success_count
+    
     def _apply_filters(self, event=None) -> None:
         """Apply filters to the logs."""
         try:
-            self.filtered_logs = self.logs.copy()
-            
-            # Apply status filter
+            # Resolve the status filter to the required success value, if any
             status_filter = self.status_var.get()
             if status_filter == "Success":
-                self.filtered_logs = [log for log in self.filtered_logs if log.result.success]
+                wanted_success = True
             elif status_filter == "Failed":
-                self.filtered_logs = [log for log in self.filtered_logs if not log.result.success]
+                wanted_success = False
+            else:
+                wanted_success = None
             
-            # Apply date filter
+            # Resolve the date filter to a cutoff time, if any
             date_filter = self.date_var.get()
+            cutoff = None
             if date_filter != "All Time":
                 now = datetime.now()
                 if date_filter == "Last 24 Hours":
@@ -275,42 +327,85 @@ class ExecutionHistoryDialog:
                     cutoff = now - timedelta(days=7)
                 elif date_filter == "Last 30 Days":
                     cutoff = now - timedelta(days=30)
-                else:
-                    cutoff = None
-                
-                if cutoff:
-                    self.filtered_logs = [log for log in self.filtered_logs if log.execution_time >= cutoff]
             
+            # Logs are newest first, so the date filter is a prefix of the list
+            candidates = self.logs
+            if cutoff:
+                end = bisect.bisect_right(self._neg_timestamps, -cutoff.timestamp())
+                candidates = self.logs[:end]
+            
+            # Filter and count successes in a single pass
+            filtered_logs = []
+            success_count = 0
+            for log in candidates:
+                success = log.result.success
+                if wanted_success is not None and success != wanted_success:
+                    continue
+                filtered_logs.append(log)
+                success_count += success
+            
+            self.filtered_logs = filtered_logs
+            self._filtered_success_count = success_count
+            self._visible_count = LOG_PAGE_SIZE
             self._update_display()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to apply filters: {str(e)}")
     
+    def _clear_display(self) -> None:
+        """Remove every row from the logs display."""
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._displayed_times.clear()
+    
     def _update_display(self) -> None:
-        """Update the logs display."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """
+        Update the logs display.
+        
+        Only the first ``_visible_count`` filtered logs are rendered. Rows are
+        keyed by log ID so a refilter only deletes rows that dropped out and
+        inserts rows that came in. ``filtered_logs`` is always an ordered
+        subsequence of ``logs``, so surviving rows keep their order. The
+        time column of surviving rows is relative to today, so it is
+        updated when its text changes, for example after midnight.
+        """
+        visible_logs = self.filtered_logs[:self._visible_count]
+        new_ids = {log.id for log in visible_logs}
+        removed_ids = self._displayed_times.keys() - new_ids
+        if removed_ids:
+            self.tree.delete(*removed_ids)
+            for log_id in removed_ids:
+                del self._displayed_times[log_id]
+        
+        # Resolve the reference date once for the whole refresh
+        now = datetime.now()
+        now_date = now.date()
+        now_year = now.year
         
         # Add filtered logs
-        for log in self.filtered_logs:
+        for index, log in enumerate(visible_logs):
+            time_str = self._format_datetime(log.execution_time, now_date, now_year)
+            shown_time_str = self._displayed_times.get(log.id)
+            if shown_time_str is not None:
+                if shown_time_str != time_str:
+                    self.tree.set(log.id, "time", time_str)
+                    self._displayed_times[log.id] = time_str
+                continue
+            
             # Format values
-            time_str = self._format_datetime(log.execution_time)
             status_str = "✅ Success" if log.result.success else "❌ Failed"
             operation_str = log.result.operation
             duration_str = f"{log.duration.total_seconds():.2f}s"
-            message_str = log.result.message[:100] + "..." if len(log.result.message) > 100 else log.result.message
+            message_str = self._message_strs[log.id]
             
             # Set row color based on status
             tags = ("success",) if log.result.success else ("failed",)
             
-            self.tree.insert("", "end", values=(
+            self.tree.insert("", index, iid=log.id, values=(
                 time_str, status_str, operation_str, duration_str, message_str
             ), tags=tags)
-        
-        # Configure row colors
-        self.tree.tag_configure("success", foreground="#28A745")
-        self.tree.tag_configure("failed", foreground="#DC3545")
+            self._displayed_times[log.id] = time_str
         
         # Update statistics
         self._update_statistics()
@@ -318,26 +413,40 @@ class ExecutionHistoryDialog:
     def _update_statistics(self) -> None:
         """Update statistics display."""
         total = len(self.filtered_logs)
+        shown = min(total, self._visible_count)
+        self.load_more_button.config(state="normal" if shown < total else "disabled")
         if total == 0:
             self.stats_label.config(text="No logs found")
             return
         
-        success_count = sum(1 for log in self.filtered_logs if log.result.success)
+        success_count = self._filtered_success_count
         failed_count = total - success_count
         success_rate = (success_count / total * 100) if total > 0 else 0
         
-        stats_text = f"Total: {total} | Success: {success_count} | Failed: {failed_count} | Success Rate: {success_rate:.1f}%"
+        stats_text = f"Showing {shown} of {total} | Success: {success_count} | Failed: {failed_count} | Success Rate: {success_rate:.1f}%"
         self.stats_label.config(text=stats_text)
     
-    def _format_datetime(self, dt: datetime) -> str:
-        """Format datetime for display."""
-        now = datetime.now()
-        if dt.date() == now.date():
-            return f"Today {dt.strftime('%H:%M:%S')}"
-        elif dt.year == now.year:
-            return dt.strftime("%m/%d %H:%M:%S")
+    def _load_more(self) -> None:
+        """Render the next page of filtered logs."""
+        self._visible_count += LOG_PAGE_SIZE
+        self._update_display()
+    
+    def _format_datetime(self, dt: datetime, now_date: date, now_year: int) -> str:
+        """
+        Format datetime for display.
+        
+        Args:
+            dt: Datetime to format
+            now_date: Today's date, computed once by the caller
+            now_year: Current year, computed once by the caller
+        """
+        time_str = f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+        if dt.date() == now_date:
+            return "Today " + time_str
+        elif dt.year == now_year:
+            return f"{dt.month:02d}/{dt.day:02d} {time_str}"
         else:
-            return dt.strftime("%Y/%m/%d %H:%M:%S")
+            return f"{dt.year}/{dt.month:02d}/{dt.day:02d} {time_str}"
     
     def _show_context_menu(self, event) -> None:
         """Show context menu."""
@@ -347,20 +456,21 @@ class ExecutionHistoryDialog:
             self.tree.selection_set(item)
             self.context_menu.post(event.x_root, event.y_root)
     
+    def _get_selected_log(self) -> Optional[ExecutionLog]:
+        """Get the log for the selected row, looked up by its iid."""
+        selection = self.tree.selection()
+        if not selection:
+            return None
+        return self._logs_by_id.get(selection[0])
+    
     def _show_log_details(self, event) -> None:
         """Show detailed information for selected log."""
         self._show_selected_log_details()
     
     def _show_selected_log_details(self) -> None:
         """Show details for the selected log entry."""
-        selection = self.tree.selection()
-        if not selection:
-            return
-        
-        # Get selected log
-        item_index = self.tree.index(selection[0])
-        if item_index < len(self.filtered_logs):
-            log = self.filtered_logs[item_index]
+        log = self._get_selected_log()
+        if log is not None:
             self._show_log_detail_dialog(log)
     
     def _show_log_detail_dialog(self, log: ExecutionLog) -> None:
@@ -432,34 +542,24 @@ Timestamp: {log.result.timestamp.isoformat()}
     
     def _format_details(self, details: Dict[str, Any]) -> str:
         """Format details dictionary for display."""
-        import json
         try:
-            return json.dumps(details, indent=2, ensure_ascii=False)
-        except:
+            return _DETAILS_ENCODER.encode(details)
+        except (TypeError, ValueError):
+            # Circular references cannot be encoded even with default=str
             return str(details)
     
     def _copy_log_message(self) -> None:
         """Copy selected log message to clipboard."""
-        selection = self.tree.selection()
-        if not selection:
-            return
-        
-        item_index = self.tree.index(selection[0])
-        if item_index < len(self.filtered_logs):
-            log = self.filtered_logs[item_index]
+        log = self._get_selected_log()
+        if log is not None:
             self.dialog.clipboard_clear()
             self.dialog.clipboard_append(log.result.message)
             messagebox.showinfo("Copied", "Log message copied to clipboard")
     
     def _copy_log_info(self) -> None:
         """Copy selected log information to clipboard."""
-        selection = self.tree.selection()
-        if not selection:
-            return
-        
-        item_index = self.tree.index(selection[0])
-        if item_index < len(self.filtered_logs):
-            log = self.filtered_logs[item_index]
+        log = self._get_selected_log()
+        if log is not None:
             info = f"""Log ID: {log.id}
 Task: {log.schedule_name}
 Time: {log.execution_time.isoformat()}
@@ -497,25 +597,53 @@ Retries: {log.retry_count}"""
         if not file_path:
             return
         
-        try:
-            # Determine format from extension
-            if file_path.lower().endswith('.csv'):
-                format_type = 'csv'
-            elif file_path.lower().endswith('.txt'):
-                format_type = 'txt'
-            else:
-                format_type = 'json'
-            
-            # Export logs
-            success = self.log_storage.export_logs(self.filtered_logs, format_type, file_path)
-            
-            if success:
-                messagebox.showinfo("Export Complete", f"Logs exported successfully to:\n{file_path}")
-            else:
-                messagebox.showerror("Export Failed", "Failed to export logs")
-                
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Error exporting logs: {str(e)}")
+        # Determine format from extension
+        if file_path.lower().endswith('.csv'):
+            format_type = 'csv'
+        elif file_path.lower().endswith('.txt'):
+            format_type = 'txt'
+        else:
+            format_type = 'json'
+        
+        # Snapshot the rows so refiltering during export does not affect it
+        logs = list(self.filtered_logs)
+        self.export_button.config(state="disabled")
+        self.stats_label.config(text=f"Exporting 0/{len(logs)} logs...")
+        
+        def on_progress(written: int, total: int) -> None:
+            self.dialog.after(0, lambda: self._on_export_progress(written, total))
+        
+        def export():
+            try:
+                success = self.log_storage.export_logs(
+                    logs, format_type, file_path, progress_callback=on_progress
+                )
+                self.dialog.after(0, lambda: self._on_export_finished(success, file_path))
+            except Exception as e:
+                error = str(e)
+                self.dialog.after(0, lambda: self._on_export_finished(False, file_path, error))
+        
+        threading.Thread(target=export, daemon=True).start()
+    
+    def _on_export_progress(self, written: int, total: int) -> None:
+        """Show background export progress on the UI thread."""
+        if self.dialog.winfo_exists():
+            self.stats_label.config(text=f"Exporting {written}/{total} logs...")
+    
+    def _on_export_finished(self, success: bool, file_path: str, error: Optional[str] = None) -> None:
+        """Handle completion of a background export on the UI thread."""
+        if not self.dialog.winfo_exists():
+            return
+        
+        self.export_button.config(state="normal")
+        self._update_statistics()
+        
+        if error:
+            messagebox.showerror("Export Error", f"Error exporting logs: {error}")
+        elif success:
+            messagebox.showinfo("Export Complete", f"Logs exported successfully to:\n{file_path}")
+        else:
+            messagebox.showerror("Export Failed", "Failed to export logs")
     
     def _refresh_logs(self) -> None:
         """Refresh the logs from storage."""
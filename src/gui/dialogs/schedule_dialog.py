@@ -11,11 +11,42 @@ import uuid
 from src.models.task import Task, TaskStatus
 from src.models.schedule import Schedule, ScheduleType, ConditionalTrigger, ConditionType
 from src.models.action import ActionType, validate_action_params
+from src.models.action_step import ActionStep, ExecutionOptions
 from src.gui.widgets.trigger_time_widget import TriggerTimeWidget
 from src.gui.widgets.conditional_trigger_widget import ConditionalTriggerWidget
 from src.gui.widgets.action_type_widget import ActionTypeWidget
 from src.gui.widgets.action_sequence_widget import ActionSequenceWidget
 from src.gui.widgets.execution_preview_widget import ExecutionPreviewWidget
+from src.gui.trigger import DebouncedTrigger
+
+
+# Initial dialog size, also used to center the dialog without measuring it
+DIALOG_WIDTH = 1000
+DIALOG_HEIGHT = 800
+
+# Delay used to coalesce bursts of change events into one preview update
+PREVIEW_UPDATE_DELAY_MS = 150
+
+# (key, label, builder method) for each notebook tab, in display order
+SCHEDULE_DIALOG_TABS = (
+    ("basic", "基本資訊", "_create_basic_info_tab"),
+    ("schedule", "排程設定", "_create_schedule_tab"),
+    ("action", "動作設定", "_create_action_tab"),
+    ("options", "選項", "_create_options_tab"),
+    ("preview", "執行預覽", "_create_preview_tab"),
+)
+
+
+# Schedule type members keyed by their string value
+SCHEDULE_TYPES_BY_VALUE = {schedule_type.value: schedule_type for schedule_type in ScheduleType}
+
+
+def _schedule_type_from_value(value) -> ScheduleType:
+    """Resolve a schedule type value (or member) to its enum member."""
+    if isinstance(value, ScheduleType):
+        return value
+    # Unknown values fall through to the enum constructor for its ValueError
+    return SCHEDULE_TYPES_BY_VALUE.get(value) or ScheduleType(value)
 
 
 class ScheduleDialog:
@@ -35,18 +66,23 @@ class ScheduleDialog:
         self.task = task
         self.on_save = on_save
         self.result = None
+        self._config_cache: Optional[Dict[str, Any]] = None
+        self._config_key: Optional[tuple] = None
+        self._config_revision = 0
+        self._last_preview_config: Optional[Dict[str, Any]] = None
+        self._last_preview_fingerprint: Optional[int] = None
+        self._preview_dirty = False
+        self._preview_ready = False
+        self._loading = False
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
+        self._preview_trigger = DebouncedTrigger(self.dialog, self._update_preview,
+                                                 PREVIEW_UPDATE_DELAY_MS)
         self.dialog.title("建立排程" if task is None else "編輯排程")
-        self.dialog.geometry("1000x800")
+        self.dialog.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}")
         self.dialog.minsize(900, 700)
         self.dialog.resizable(True, True)
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
-        
-        # Center dialog on parent
-        self._center_dialog()
         
         # Initialize widgets
         self.schedule_name_var = tk.StringVar()
@@ -74,30 +110,26 @@ class ScheduleDialog:
         # Bind events
         self._bind_events()
         
-        # Update preview initially
+        # Change notifications fired while building and loading are folded
+        # into this single initial update
+        self._preview_ready = True
         self._update_preview()
     
     def _center_dialog(self):
         """Center the dialog on the parent window."""
-        self.dialog.update_idletasks()
-        
         # Get screen dimensions
         screen_width = self.dialog.winfo_screenwidth()
         screen_height = self.dialog.winfo_screenheight()
         
-        # Get dialog dimensions
-        dialog_width = 1000
-        dialog_height = 800
-        
         # Calculate center position on screen
-        x = (screen_width - dialog_width) // 2
-        y = (screen_height - dialog_height) // 2
+        x = (screen_width - DIALOG_WIDTH) // 2
+        y = (screen_height - DIALOG_HEIGHT) // 2
         
         # Ensure dialog is not positioned off-screen
         x = max(0, x)
         y = max(0, y)
         
-        self.dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+        self.dialog.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}+{x}+{y}")
     
     def _create_ui(self):
         """Create the dialog UI."""
@@ -109,135 +141,204 @@ class ScheduleDialog:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Basic Information Tab
-        self._create_basic_info_tab()
+        # Tab frames are added up front; all but the first tab are filled in
+        # the first time they are selected
+        self._tab_frames: Dict[str, ttk.Frame] = {}
+        self._tab_keys: Dict[str, str] = {}
+        self._pending_tabs: Dict[str, Callable[[ttk.Frame], None]] = {}
+        self._tab_loaders: Dict[str, Callable[[], None]] = {}
         
-        # Schedule Settings Tab
-        self._create_schedule_tab()
+        for key, text, builder_name in SCHEDULE_DIALOG_TABS:
+            self._add_tab(key, text, getattr(self, builder_name), lazy=key != "basic")
         
-        # Action Settings Tab
-        self._create_action_tab()
-        
-        # Options Tab
-        self._create_options_tab()
-        
-        # Preview Tab
-        self._create_preview_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Button frame
         self._create_button_frame(main_frame)
     
-    def _create_basic_info_tab(self):
-        """Create the basic information tab."""
-        basic_frame = ttk.Frame(self.notebook)
-        self.notebook.add(basic_frame, text="基本資訊")
+    def _add_tab(self, key: str, text: str, builder: Callable[[ttk.Frame], None],
+                 lazy: bool = True):
+        """
+        Add a notebook tab and build its contents now or on first selection.
         
+        Args:
+            key: Internal tab identifier
+            text: Tab label
+            builder: Function that creates the tab contents in the given frame
+            lazy: Defer building until the tab is first selected
+        """
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=text)
+        self._tab_frames[key] = frame
+        self._tab_keys[str(frame)] = key
+        
+        if lazy:
+            self._pending_tabs[key] = builder
+        else:
+            builder(frame)
+    
+    def _build_tabs(self, *keys: str):
+        """Build the given tabs if they have not been built yet."""
+        for key in keys:
+            builder = self._pending_tabs.pop(key, None)
+            if builder:
+                builder(self._tab_frames[key])
+                self._run_tab_loader(key)
+    
+    def _defer_tab_load(self, key: str, loader: Callable[[], None]):
+        """
+        Run a data loader once the given tab has been built.
+        
+        Args:
+            key: Internal tab identifier
+            loader: Function that fills the tab's widgets with task data
+        """
+        self._tab_loaders[key] = loader
+        if key not in self._pending_tabs:
+            self._run_tab_loader(key)
+    
+    def _run_tab_loader(self, key: str):
+        """Run and discard the pending data loader for a built tab."""
+        loader = self._tab_loaders.pop(key, None)
+        if loader:
+            # Widget setters notify once per field; schedule one update at the end
+            self._loading = True
+            try:
+                loader()
+            finally:
+                self._loading = False
+            self._schedule_preview_update()
+    
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab on first display and refresh a stale preview."""
+        key = self._tab_keys.get(self.notebook.select())
+        if key == "preview":
+            if self._pending_tabs:
+                # The preview summarizes every other tab
+                self._build_tabs(*self._pending_tabs)
+                self._invalidate_config()
+                self._preview_dirty = True
+            if self._preview_dirty:
+                self._update_preview()
+        else:
+            self._build_tabs(key)
+    
+    def _is_preview_visible(self) -> bool:
+        """Check whether the preview tab is the selected tab."""
+        return self._tab_keys.get(self.notebook.select()) == "preview"
+    
+    def _create_section(self, parent: tk.Widget, title: str, **pack_options) -> ttk.LabelFrame:
+        """
+        Create a titled, horizontally filled section frame.
+        
+        Args:
+            parent: Frame the section is packed into
+            title: Section title
+            **pack_options: Extra pack() options such as padding
+            
+        Returns:
+            The packed LabelFrame
+        """
+        section = ttk.LabelFrame(parent, text=title, padding=10)
+        section.pack(fill=tk.X, **pack_options)
+        return section
+    
+    def _create_basic_info_tab(self, basic_frame: ttk.Frame):
+        """Create the basic information tab."""
         # Schedule name
-        name_frame = ttk.LabelFrame(basic_frame, text="排程名稱", padding=10)
-        name_frame.pack(fill=tk.X, pady=(0, 10))
+        name_frame = self._create_section(basic_frame, "排程名稱", pady=(0, 10))
         
         ttk.Label(name_frame, text="名稱:").pack(anchor=tk.W)
         name_entry = ttk.Entry(name_frame, textvariable=self.schedule_name_var, font=("", 10))
         name_entry.pack(fill=tk.X, pady=(5, 0))
     
-    def _create_schedule_tab(self):
+    def _create_schedule_tab(self, schedule_frame: ttk.Frame):
         """Create the schedule settings tab."""
-        schedule_frame = ttk.Frame(self.notebook)
-        self.notebook.add(schedule_frame, text="排程設定")
-        
-        # Create scrollable frame for schedule tab
-        canvas = tk.Canvas(schedule_frame, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(schedule_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        content = self._create_scroll_area(schedule_frame)
         
         # Trigger time widget
-        trigger_frame = ttk.LabelFrame(scrollable_frame, text="觸發時間", padding=10)
-        trigger_frame.pack(fill=tk.X, pady=(0, 10), padx=10)
+        trigger_frame = self._create_section(content, "觸發時間", pady=(0, 10), padx=10)
         
         self.trigger_time_widget = TriggerTimeWidget(trigger_frame, 
-                                                   on_change=self._update_preview)
+                                                   on_change=self._schedule_preview_update)
         self.trigger_time_widget.pack(fill=tk.X)
         
         # Conditional trigger widget
-        condition_frame = ttk.LabelFrame(scrollable_frame, text="條件觸發", padding=10)
-        condition_frame.pack(fill=tk.X, padx=10)
+        condition_frame = self._create_section(content, "條件觸發", padx=10)
         
         self.conditional_trigger_widget = ConditionalTriggerWidget(condition_frame,
-                                                                 on_change=self._update_preview)
+                                                                 on_change=self._schedule_preview_update)
         self.conditional_trigger_widget.pack(fill=tk.X)
+    
+    def _create_scroll_area(self, parent: tk.Widget) -> ttk.Frame:
+        """
+        Create a vertically scrollable area filling a parent.
+        
+        The scrollbar is only shown while the content is taller than the
+        visible area, such as for weekly or custom schedules or with large
+        fonts.
         
-        # Bind mouse wheel to canvas
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        canvas.bind("<MouseWheel>", _on_mousewheel)
+        Args:
+            parent: Parent widget
+            
+        Returns:
+            Frame to pack the scrollable content into
+        """
+        canvas = tk.Canvas(parent, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
+        content = ttk.Frame(canvas)
+        window = canvas.create_window((0, 0), window=content, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        def update_scrolling(event=None):
+            # Content follows the canvas width; its height decides scrolling
+            canvas.itemconfigure(window, width=canvas.winfo_width())
+            content_height = content.winfo_reqheight()
+            canvas.configure(scrollregion=(0, 0, canvas.winfo_width(), content_height))
+            needs_scrolling = content_height > canvas.winfo_height()
+            if needs_scrolling and not scrollbar.winfo_manager():
+                scrollbar.pack(side=tk.RIGHT, fill=tk.Y, before=canvas)
+            elif not needs_scrolling and scrollbar.winfo_manager():
+                scrollbar.pack_forget()
+                canvas.yview_moveto(0)
+        
+        content.bind("<Configure>", update_scrolling)
+        canvas.bind("<Configure>", update_scrolling)
+        
+        def on_mousewheel(event):
+            if scrollbar.winfo_manager():
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        canvas.bind("<MouseWheel>", on_mousewheel)
+        
+        return content
     
-    def _create_action_tab(self):
+    def _create_action_tab(self, action_frame: ttk.Frame):
         """Create the action settings tab."""
-        action_frame = ttk.Frame(self.notebook)
-        self.notebook.add(action_frame, text="動作設定")
-        
         # Place action sequence widget directly and let it manage its own scroll to maximize available space
         self.action_sequence_widget = ActionSequenceWidget(action_frame, 
-                                                          on_change=self._update_preview)
+                                                          on_change=self._schedule_preview_update)
         self.action_sequence_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
     
-    def _create_options_tab(self):
+    def _create_options_tab(self, options_frame: ttk.Frame):
         """Create the options tab."""
-        options_frame = ttk.Frame(self.notebook)
-        self.notebook.add(options_frame, text="選項")
-        
-        # Repeat options
-        repeat_frame = ttk.LabelFrame(options_frame, text="重複選項", padding=10)
-        repeat_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        repeat_check = ttk.Checkbutton(repeat_frame, text="啟用重複執行", 
-                                     variable=self.repeat_enabled_var,
-                                     command=self._update_preview)
-        repeat_check.pack(anchor=tk.W)
-        
-        # Retry options
-        retry_frame = ttk.LabelFrame(options_frame, text="重試選項", padding=10)
-        retry_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        retry_check = ttk.Checkbutton(retry_frame, text="失敗時自動重試", 
-                                    variable=self.retry_enabled_var,
-                                    command=self._update_preview)
-        retry_check.pack(anchor=tk.W)
-        
-        # Notification options
-        notification_frame = ttk.LabelFrame(options_frame, text="通知選項", padding=10)
-        notification_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        notification_check = ttk.Checkbutton(notification_frame, text="顯示執行通知", 
-                                           variable=self.notification_enabled_var,
-                                           command=self._update_preview)
-        notification_check.pack(anchor=tk.W)
-        
-        # Logging options
-        logging_frame = ttk.LabelFrame(options_frame, text="日誌選項", padding=10)
-        logging_frame.pack(fill=tk.X)
-        
-        logging_check = ttk.Checkbutton(logging_frame, text="記錄執行日誌", 
-                                      variable=self.logging_enabled_var,
-                                      command=self._update_preview)
-        logging_check.pack(anchor=tk.W)
-    
-    def _create_preview_tab(self):
+        # (group title, checkbox label, variable) for each option
+        options = [
+            ("重複選項", "啟用重複執行", self.repeat_enabled_var),
+            ("重試選項", "失敗時自動重試", self.retry_enabled_var),
+            ("通知選項", "顯示執行通知", self.notification_enabled_var),
+            ("日誌選項", "記錄執行日誌", self.logging_enabled_var),
+        ]
+        
+        for index, (title, text, variable) in enumerate(options):
+            is_last = index == len(options) - 1
+            group_frame = self._create_section(options_frame, title,
+                                               pady=0 if is_last else (0, 10))
+            
+            ttk.Checkbutton(group_frame, text=text, variable=variable).pack(anchor=tk.W)
+    
+    def _create_preview_tab(self, preview_frame: ttk.Frame):
         """Create the preview tab."""
-        preview_frame = ttk.Frame(self.notebook)
-        self.notebook.add(preview_frame, text="執行預覽")
-        
         # Execution preview widget
         self.execution_preview_widget = ExecutionPreviewWidget(preview_frame)
         self.execution_preview_widget.pack(fill=tk.BOTH, expand=True)
@@ -263,8 +364,13 @@ class ScheduleDialog:
         """Bind dialog events."""
         self.dialog.protocol("WM_DELETE_WINDOW", self._on_cancel)
         
-        # Bind variable changes to update preview
-        self.schedule_name_var.trace_add("write", lambda *args: self._update_preview())
+        # Variable traces catch every change to the name and options, whether
+        # typed, pasted, clicked or set in code. Traces are added after the
+        # task is loaded, so loading doesn't schedule extra updates
+        for variable in (self.schedule_name_var, self.repeat_enabled_var,
+                         self.retry_enabled_var, self.notification_enabled_var,
+                         self.logging_enabled_var):
+            variable.trace_add("write", self._schedule_preview_update)
     
     def _load_task_data(self):
         """Load task data into the dialog."""
@@ -274,62 +380,131 @@ class ScheduleDialog:
         # Load basic info
         self.schedule_name_var.set(self.task.name)
         
-        # Load schedule settings
+        # Schedule and action widgets are filled in when their tabs are built
+        self._defer_tab_load("schedule", self._load_schedule_data)
+        self._defer_tab_load("action", self._load_action_data)
+        
+        # Load options
+        self.repeat_enabled_var.set(self.task.schedule.repeat_enabled)
+        # Note: retry, notification, and logging options would need to be stored in task model
+        
+        self._schedule_preview_update()
+    
+    def _load_schedule_data(self):
+        """Load the task's schedule settings into the schedule tab."""
         if self.trigger_time_widget:
             self.trigger_time_widget.set_schedule(self.task.schedule)
         
         if self.conditional_trigger_widget and self.task.schedule.conditional_trigger:
             self.conditional_trigger_widget.set_trigger(self.task.schedule.conditional_trigger)
+    
+    def _load_action_data(self):
+        """Load the task's action sequence into the action tab."""
+        if not self.action_sequence_widget:
+            return
         
-        # Load action settings
-        if self.action_sequence_widget:
-            # Load action sequence
-            if hasattr(self.task, 'action_sequence') and self.task.action_sequence:
-                self.action_sequence_widget.set_action_sequence(self.task.action_sequence)
-            elif hasattr(self.task, 'action_type'):
-                # Old format - convert to action sequence
-                from src.models.action_step import ActionStep
-                action_step = ActionStep.create(
-                    action_type=self.task.action_type,
-                    action_params=getattr(self.task, 'action_params', {}),
-                    description=f"{self.task.action_type.value} on {self.task.target_app}"
-                )
-                self.action_sequence_widget.set_action_sequence([action_step])
+        action_sequence = getattr(self.task, 'action_sequence', None)
+        action_type = getattr(self.task, 'action_type', None)
+        if action_sequence:
+            self.action_sequence_widget.set_action_sequence(action_sequence)
+        elif action_type is not None:
+            # Old format - convert to action sequence
+            action_step = ActionStep.create(
+                action_type=action_type,
+                action_params=getattr(self.task, 'action_params', {}),
+                description=f"{action_type.value} on {self.task.target_app}"
+            )
+            self.action_sequence_widget.set_action_sequence([action_step])
+    
+    def _schedule_preview_update(self, *args):
+        """Schedule a preview update, coalescing bursts of changes into one."""
+        self._config_revision += 1
+        if not self._preview_ready or self._loading:
+            return
         
-        # Load options
-        self.repeat_enabled_var.set(self.task.schedule.repeat_enabled)
-        # Note: retry, notification, and logging options would need to be stored in task model
+        # Off the preview tab there is nothing to refresh until it is shown
+        if self._is_preview_visible():
+            self._preview_trigger()
+        else:
+            self._preview_dirty = True
     
     def _update_preview(self):
         """Update the execution preview."""
         if not self.execution_preview_widget:
             return
         
+        # Defer the repaint until the preview tab is shown
+        if not self._is_preview_visible():
+            self._preview_dirty = True
+            return
+        self._preview_dirty = False
+        
+        # Get current configuration
+        config = self._get_schedule_config()
+        if not config:
+            return
+        
+        # A cache hit returns the very dict already shown, so it can be
+        # skipped without formatting a fingerprint
+        if config is self._last_preview_config:
+            return
+        self._last_preview_config = config
+        
+        # Skip the repaint when a rebuilt config has the same contents
+        fingerprint = hash(repr(config))
+        if fingerprint == self._last_preview_fingerprint:
+            return
+        
         try:
-            # Get current configuration
-            config = self._get_schedule_config()
-            if config:
-                self.execution_preview_widget.update_preview(config)
-        except Exception as e:
-            # Handle preview update errors silently
-            pass
+            self.execution_preview_widget.update_preview(config)
+        except (tk.TclError, ValueError, TypeError):
+            # Half-typed input can't be previewed yet; the next edit retries
+            return
+        self._last_preview_fingerprint = fingerprint
     
     def _get_schedule_config(self) -> Optional[Dict[str, Any]]:
-        """Get the current schedule configuration."""
+        """
+        Get the current schedule configuration.
+        
+        The result is cached against the dialog's own variables plus a
+        revision counter bumped by every sub-widget change notification, so
+        repeated reads within one interaction don't walk the sub-widgets
+        again, while programmatic variable changes still invalidate it.
+        """
+        key = self._config_cache_key()
+        if key == self._config_key:
+            return self._config_cache
+        
+        self._config_cache = self._build_schedule_config()
+        self._config_key = key
+        return self._config_cache
+    
+    def _config_cache_key(self) -> tuple:
+        """Get the cheap values that identify the current configuration."""
+        return (
+            self.schedule_name_var.get(),
+            self.repeat_enabled_var.get(),
+            self.retry_enabled_var.get(),
+            self.notification_enabled_var.get(),
+            self.logging_enabled_var.get(),
+            self._config_revision,
+        )
+    
+    def _invalidate_config(self):
+        """Force the next configuration read to query the widgets again."""
+        self._config_revision += 1
+    
+    def _build_schedule_config(self) -> Optional[Dict[str, Any]]:
+        """Build the schedule configuration from the current widget state."""
+        # Basic info
+        name = self.schedule_name_var.get().strip()
+        
+        if not name or self.trigger_time_widget is None or self.action_sequence_widget is None:
+            return None
+        
         try:
-            # Basic info
-            name = self.schedule_name_var.get().strip()
-            
-            if not name:
-                return None
-            
             # Schedule settings
-            schedule_config = None
-            if self.trigger_time_widget:
-                schedule_config = self.trigger_time_widget.get_schedule_config()
-            
-            if not schedule_config:
-                return None
+            schedule_config = self.trigger_time_widget.get_schedule_config()
             
             # Conditional trigger
             conditional_trigger = None
@@ -337,39 +512,43 @@ class ScheduleDialog:
                 conditional_trigger = self.conditional_trigger_widget.get_trigger_config()
             
             # Action settings
-            action_sequence_config = None
-            if self.action_sequence_widget:
-                action_sequence_config = self.action_sequence_widget.get_action_sequence_config()
-            
-            if not action_sequence_config:
-                return None
-            
-            # Get target app from first action that has app_name parameter
-            target_app = "未指定"
-            for action_config in action_sequence_config:
-                if 'app_name' in action_config.get('action_params', {}):
-                    target_app = action_config['action_params']['app_name']
-                    break
-            
-            return {
-                'name': name,
-                'target_app': target_app,
-                'schedule': schedule_config,
-                'conditional_trigger': conditional_trigger,
-                'action_sequence': action_sequence_config,
-                'options': {
-                    'repeat_enabled': self.repeat_enabled_var.get(),
-                    'retry_enabled': self.retry_enabled_var.get(),
-                    'notification_enabled': self.notification_enabled_var.get(),
-                    'logging_enabled': self.logging_enabled_var.get()
-                }
-            }
-        except Exception:
+            action_sequence_config = self.action_sequence_widget.get_action_sequence_config()
+        except (tk.TclError, ValueError, TypeError):
+            # Numeric variables raise TclError and the sub-widgets' date and
+            # interval parsing raises ValueError/TypeError on partial input
             return None
+        
+        if not schedule_config or not action_sequence_config:
+            return None
+        
+        # Get target app from first action that has app_name parameter
+        target_app = "未指定"
+        for action_config in action_sequence_config:
+            if 'app_name' in action_config.get('action_params', {}):
+                target_app = action_config['action_params']['app_name']
+                break
+        
+        return {
+            'name': name,
+            'target_app': target_app,
+            'schedule': schedule_config,
+            'conditional_trigger': conditional_trigger,
+            'action_sequence': action_sequence_config,
+            'options': {
+                'repeat_enabled': self.repeat_enabled_var.get(),
+                'retry_enabled': self.retry_enabled_var.get(),
+                'notification_enabled': self.notification_enabled_var.get(),
+                'logging_enabled': self.logging_enabled_var.get()
+            }
+        }
     
-    def _validate_schedule(self) -> bool:
-        """Validate the schedule configuration."""
-        config = self._get_schedule_config()
+    def _validate_schedule(self, config: Optional[Dict[str, Any]]) -> bool:
+        """
+        Validate the schedule configuration.
+        
+        Args:
+            config: Configuration returned by _get_schedule_config
+        """
         if not config:
             messagebox.showerror("驗證錯誤", "請填寫所有必要欄位")
             return False
@@ -382,17 +561,36 @@ class ScheduleDialog:
         
         return True
     
-    def _create_task_from_config(self) -> Optional[Task]:
-        """Create a Task object from the current configuration."""
+    def _get_validated_config(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the widgets once and validate the result for save or test.
+        
+        Returns:
+            The configuration, or None if it is incomplete or invalid
+        """
+        # Unvisited tabs still hold required settings, so build them first
+        self._build_tabs("schedule", "action")
+        self._invalidate_config()
         config = self._get_schedule_config()
-        if not config:
+        if not self._validate_schedule(config):
             return None
+        return config
+    
+    def _create_task_from_config(self, config: Dict[str, Any]) -> Optional[Task]:
+        """
+        Create a Task object from a validated configuration.
+        
+        Args:
+            config: Configuration returned by _get_schedule_config
+        """
+        # Read the clock once for both the creation time and next execution
+        now = datetime.now()
         
         try:
             # Create schedule
             schedule_config = config['schedule']
             schedule = Schedule(
-                schedule_type=ScheduleType(schedule_config['schedule_type']),
+                schedule_type=_schedule_type_from_value(schedule_config['schedule_type']),
                 start_time=schedule_config['start_time'],
                 end_time=schedule_config.get('end_time'),
                 interval=schedule_config.get('interval'),
@@ -402,19 +600,18 @@ class ScheduleDialog:
             )
             
             # Create action sequence from config
-            from src.models.action_step import ActionStep, ExecutionOptions
-            
-            action_steps = self.action_sequence_widget.get_action_steps()
+            action_steps = self.action_sequence_widget.get_action_steps(config['action_sequence'])
             if not action_steps:
                 raise ValueError("無法取得有效的動作序列")
             
-            # Create or update task
+            # Create or update task; ExecutionOptions is mutable, so each task
+            # gets its own default instance rather than a shared one
             if self.task:
                 # Update existing task
                 self.task.name = config['name']
                 self.task.target_app = config['target_app']
                 self.task.action_sequence = action_steps
-                if not hasattr(self.task, 'execution_options'):
+                if getattr(self.task, 'execution_options', None) is None:
                     self.task.execution_options = ExecutionOptions.get_default()
                 self.task.schedule = schedule
                 task = self.task
@@ -428,11 +625,11 @@ class ScheduleDialog:
                     schedule=schedule,
                     status=TaskStatus.PENDING,
                     execution_options=ExecutionOptions.get_default(),
-                    created_at=datetime.now()
+                    created_at=now
                 )
             
             # Update next execution time
-            task.update_next_execution()
+            task.update_next_execution(from_time=now)
             
             return task
         except Exception as e:
@@ -441,10 +638,11 @@ class ScheduleDialog:
     
     def _on_save(self):
         """Handle save button click."""
-        if not self._validate_schedule():
+        config = self._get_validated_config()
+        if not config:
             return
         
-        task = self._create_task_from_config()
+        task = self._create_task_from_config(config)
         if not task:
             return
         
@@ -458,36 +656,37 @@ class ScheduleDialog:
                 messagebox.showerror("儲存錯誤", f"儲存任務時發生錯誤: {str(e)}")
                 return
         
+        self._preview_trigger.cancel()
         self.dialog.destroy()
     
     def _on_cancel(self):
         """Handle cancel button click."""
         self.result = None
+        self._preview_trigger.cancel()
         self.dialog.destroy()
     
     def _on_test(self):
         """Handle test button click."""
-        if not self._validate_schedule():
+        config = self._get_validated_config()
+        if not config:
             return
         
-        config = self._get_schedule_config()
-        if config:
-            # Show test information
-            action_info = []
-            for i, action_config in enumerate(config['action_sequence']):
-                action_info.append(f"動作 {i+1}: {action_config['action_type'].value}")
-                action_info.append(f"  參數: {action_config['action_params']}")
-            
-            test_info = f"""
-測試配置:
-排程名稱: {config['name']}
-目標應用程式: {config['target_app']}
-動作序列:
-{chr(10).join(action_info)}
-
-注意: 這是測試模式，不會實際執行動作。
-            """
-            messagebox.showinfo("測試配置", test_info.strip())
+        # Show test information
+        action_info = "\n".join(
+            f"動作 {i + 1}: {action_config['action_type'].value}\n"
+            f"  參數: {action_config['action_params']}"
+            for i, action_config in enumerate(config['action_sequence'])
+        )
+        
+        test_info = (
+            f"測試配置:\n"
+            f"排程名稱: {config['name']}\n"
+            f"目標應用程式: {config['target_app']}\n"
+            f"動作序列:\n"
+            f"{action_info}\n\n"
+            f"注意: 這是測試模式，不會實際執行動作。"
+        )
+        messagebox.showinfo("測試配置", test_info)
     
     def show(self) -> Optional[Task]:
         """
@@ -496,5 +695,10 @@ class ScheduleDialog:
         Returns:
             Task object if saved, None if cancelled
         """
+        # Make the dialog modal only once its widgets are built
+        self.dialog.transient(self.parent)
+        self._center_dialog()
+        self.dialog.grab_set()
+        
         self.dialog.wait_window()
         return self.result
\ No newline at end of file
@@ -6,15 +6,95 @@ and allows users to make informed decisions about security-sensitive actions.
 """
 
 import tkinter as tk
+from concurrent.futures import Future
 from tkinter import ttk, messagebox
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 from datetime import datetime
 
 from src.core.security_manager import SecurityLevel, OperationType
 
 
+# Fixed dialog size, so the window can be placed without a layout pass
+DIALOG_WIDTH = 500
+DIALOG_HEIGHT = 400
+
+# Security level colors and icons
+LEVEL_CONFIG = MappingProxyType({
+    SecurityLevel.DANGEROUS: MappingProxyType({
+        "color": "#dc3545",
+        "icon": "⚠️",
+        "text": "危險操作",
+        "description": "此操作可能會影響系統穩定性或安全性"
+    }),
+    SecurityLevel.HIGH_RISK: MappingProxyType({
+        "color": "#fd7e14",
+        "icon": "⚠️",
+        "text": "高風險操作",
+        "description": "此操作具有較高的風險，請謹慎考慮"
+    }),
+    SecurityLevel.MEDIUM_RISK: MappingProxyType({
+        "color": "#ffc107",
+        "icon": "⚡",
+        "text": "中等風險操作",
+        "description": "此操作可能會產生意外的結果"
+    })
+})
+
+RISK_MESSAGES = MappingProxyType({
+    SecurityLevel.DANGEROUS: (
+        "• 此操作可能會導致系統不穩定",
+        "• 可能會影響其他正在運行的應用程式",
+        "• 建議在執行前備份重要資料",
+        "• 請確保您了解此操作的後果"
+    ),
+    SecurityLevel.HIGH_RISK: (
+        "• 此操作可能會產生意外的結果",
+        "• 建議在非工作時間執行",
+        "• 請確保目標應用程式處於適當狀態",
+        "• 執行前請檢查相關設定"
+    ),
+    SecurityLevel.MEDIUM_RISK: (
+        "• 此操作通常是安全的",
+        "• 但仍可能產生意外的結果",
+        "• 建議先在測試環境中驗證",
+        "• 請確認操作參數正確"
+    )
+})
+
+# Label styles shared by every confirmation dialog
+LABEL_STYLES = MappingProxyType({
+    "SecurityIcon.TLabel": {"font": ("Arial", 16)},
+    "SecurityTitle.TLabel": {"font": ("Arial", 14, "bold")},
+    "SecurityDescription.TLabel": {"font": ("Arial", 10), "foreground": "gray"},
+    "SecurityField.TLabel": {"font": ("Arial", 9, "bold")},
+    "SecurityRisk.TLabel": {"font": ("Arial", 9)},
+})
+
+# Bind tag carrying the Enter/Escape bindings shared by every confirmation dialog
+DIALOG_BIND_TAG = "SecurityConfirmationDialog"
+
+OPERATION_DISPLAY_NAMES = MappingProxyType({
+    OperationType.TASK_CREATE: "建立任務",
+    OperationType.TASK_EDIT: "編輯任務",
+    OperationType.TASK_DELETE: "刪除任務",
+    OperationType.TASK_EXECUTE: "執行任務",
+    OperationType.APP_LAUNCH: "啟動應用程式",
+    OperationType.APP_CLOSE: "關閉應用程式",
+    OperationType.WINDOW_CONTROL: "視窗控制",
+    OperationType.CUSTOM_COMMAND: "自訂命令",
+    OperationType.CONFIG_CHANGE: "配置變更",
+    OperationType.SYSTEM_ACCESS: "系統存取"
+})
+
+
 class SecurityConfirmationDialog:
-    """Dialog for confirming dangerous operations."""
+    """
+    Dialog for confirming dangerous operations.
+    
+    The constructor opens the dialog and returns immediately. The user's
+    choice resolves ``future``; call ``wait()`` to block until it is made.
+    """
     
     def __init__(self, parent: tk.Widget, operation_type: OperationType,
                  target: str, parameters: Dict[str, Any], 
@@ -25,27 +105,46 @@ class SecurityConfirmationDialog:
         self.parameters = parameters
         self.security_level = security_level
         self.result = False
+        self._future: Future = Future()
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("安全確認")
         self.dialog.resizable(False, False)
+        self.dialog.protocol("WM_DELETE_WINDOW", self._cancel)
         self.dialog.grab_set()  # Make dialog modal
         
         # Center dialog on parent
         self._center_dialog()
         
         # Create dialog content
+        self._configure_styles()
         self._create_widgets()
+        self._install_key_bindings()
         
-        # Set focus and wait for result
         self.dialog.focus_set()
-        self.dialog.wait_window()
+    
+    @property
+    def future(self) -> Future:
+        """Future resolved with True on confirm and False on cancel."""
+        return self._future
+    
+    def wait(self) -> bool:
+        """
+        Wait for the user's choice while keeping the event loop running.
+        
+        Returns:
+            True if user confirms, False otherwise
+        """
+        if not self._future.done():
+            self.dialog.wait_window()
+        # A window destroyed by other means counts as a cancel
+        if not self._future.done():
+            self._future.set_result(False)
+        return self._future.result()
     
     def _center_dialog(self):
         """Center the dialog on the parent window."""
-        self.dialog.update_idletasks()
-        
         # Get parent window position and size
         parent_x = self.parent.winfo_rootx()
         parent_y = self.parent.winfo_rooty()
@@ -53,12 +152,18 @@ class SecurityConfirmationDialog:
         parent_height = self.parent.winfo_height()
         
         # Calculate dialog position
-        dialog_width = 500
-        dialog_height = 400
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
+        x = parent_x + (parent_width - DIALOG_WIDTH) // 2
+        y = parent_y + (parent_height - DIALOG_HEIGHT) // 2
         
-        self.dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+        self.dialog.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}+{x}+{y}")
+    
+    def _configure_styles(self):
+        """Configure the shared label styles once per Tk interpreter."""
+        style = ttk.Style(self.dialog)
+        if style.lookup("SecurityTitle.TLabel", "font"):
+            return
+        for name, options in LABEL_STYLES.items():
+            style.configure(name, **options)
     
     def _create_widgets(self):
         """Create dialog widgets."""
@@ -83,44 +188,22 @@ class SecurityConfirmationDialog:
         indicator_frame = ttk.Frame(parent)
         indicator_frame.pack(fill=tk.X, pady=(0, 15))
         
-        # Security level colors and icons
-        level_config = {
-            SecurityLevel.DANGEROUS: {
-                "color": "#dc3545",
-                "icon": "⚠️",
-                "text": "危險操作",
-                "description": "此操作可能會影響系統穩定性或安全性"
-            },
-            SecurityLevel.HIGH_RISK: {
-                "color": "#fd7e14", 
-                "icon": "⚠️",
-                "text": "高風險操作",
-                "description": "此操作具有較高的風險，請謹慎考慮"
-            },
-            SecurityLevel.MEDIUM_RISK: {
-                "color": "#ffc107",
-                "icon": "⚡",
-                "text": "中等風險操作", 
-                "description": "此操作可能會產生意外的結果"
-            }
-        }
-        
-        config = level_config.get(self.security_level, level_config[SecurityLevel.MEDIUM_RISK])
+        config = LEVEL_CONFIG.get(self.security_level, LEVEL_CONFIG[SecurityLevel.MEDIUM_RISK])
         
         # Icon and title
         title_frame = ttk.Frame(indicator_frame)
         title_frame.pack(fill=tk.X)
         
-        icon_label = ttk.Label(title_frame, text=config["icon"], font=("Arial", 16))
+        icon_label = ttk.Label(title_frame, text=config["icon"], style="SecurityIcon.TLabel")
         icon_label.pack(side=tk.LEFT, padx=(0, 10))
         
-        title_label = ttk.Label(title_frame, text=config["text"], 
-                               font=("Arial", 14, "bold"))
+        title_label = ttk.Label(title_frame, text=config["text"],
+                               style="SecurityTitle.TLabel")
         title_label.pack(side=tk.LEFT)
         
         # Description
         desc_label = ttk.Label(indicator_frame, text=config["description"],
-                              font=("Arial", 10), foreground="gray")
+                              style="SecurityDescription.TLabel")
         desc_label.pack(fill=tk.X, pady=(5, 0))
     
     def _create_operation_details(self, parent: ttk.Frame):
@@ -132,14 +215,14 @@ class SecurityConfirmationDialog:
         type_frame = ttk.Frame(details_frame)
         type_frame.pack(fill=tk.X, pady=(0, 5))
         
-        ttk.Label(type_frame, text="操作類型:", font=("Arial", 9, "bold")).pack(side=tk.LEFT)
+        ttk.Label(type_frame, text="操作類型:", style="SecurityField.TLabel").pack(side=tk.LEFT)
         ttk.Label(type_frame, text=self._get_operation_display_name()).pack(side=tk.LEFT, padx=(10, 0))
         
         # Target
         target_frame = ttk.Frame(details_frame)
         target_frame.pack(fill=tk.X, pady=(0, 5))
         
-        ttk.Label(target_frame, text="目標:", font=("Arial", 9, "bold")).pack(side=tk.LEFT)
+        ttk.Label(target_frame, text="目標:", style="SecurityField.TLabel").pack(side=tk.LEFT)
         ttk.Label(target_frame, text=self.target).pack(side=tk.LEFT, padx=(10, 0))
         
         # Parameters (if any)
@@ -147,7 +230,7 @@ class SecurityConfirmationDialog:
             params_frame = ttk.Frame(details_frame)
             params_frame.pack(fill=tk.X, pady=(5, 0))
             
-            ttk.Label(params_frame, text="參數:", font=("Arial", 9, "bold")).pack(anchor=tk.W)
+            ttk.Label(params_frame, text="參數:", style="SecurityField.TLabel").pack(anchor=tk.W)
             
             # Create scrollable text widget for parameters
             params_text = tk.Text(params_frame, height=4, width=50, wrap=tk.WORD)
@@ -157,10 +240,9 @@ class SecurityConfirmationDialog:
             params_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=(5, 0))
             params_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=(5, 0))
             
-            # Insert parameters
-            for key, value in self.parameters.items():
-                params_text.insert(tk.END, f"{key}: {value}\n")
-            
+            # Insert all parameters in one call, then lock the widget
+            params_text.insert(tk.END, "".join(f"{key}: {value}\n"
+                                               for key, value in self.parameters.items()))
             params_text.config(state=tk.DISABLED)
     
     def _create_risk_information(self, parent: ttk.Frame):
@@ -168,32 +250,10 @@ class SecurityConfirmationDialog:
         risk_frame = ttk.LabelFrame(parent, text="風險資訊", padding="10")
         risk_frame.pack(fill=tk.X, pady=(0, 15))
         
-        risk_messages = {
-            SecurityLevel.DANGEROUS: [
-                "• 此操作可能會導致系統不穩定",
-                "• 可能會影響其他正在運行的應用程式",
-                "• 建議在執行前備份重要資料",
-                "• 請確保您了解此操作的後果"
-            ],
-            SecurityLevel.HIGH_RISK: [
-                "• 此操作可能會產生意外的結果",
-                "• 建議在非工作時間執行",
-                "• 請確保目標應用程式處於適當狀態",
-                "• 執行前請檢查相關設定"
-            ],
-            SecurityLevel.MEDIUM_RISK: [
-                "• 此操作通常是安全的",
-                "• 但仍可能產生意外的結果",
-                "• 建議先在測試環境中驗證",
-                "• 請確認操作參數正確"
-            ]
-        }
-        
-        messages = risk_messages.get(self.security_level, risk_messages[SecurityLevel.MEDIUM_RISK])
-        
-        for message in messages:
-            label = ttk.Label(risk_frame, text=message, font=("Arial", 9))
-            label.pack(anchor=tk.W, pady=1)
+        # One label holds every message line
+        messages = RISK_MESSAGES.get(self.security_level, RISK_MESSAGES[SecurityLevel.MEDIUM_RISK])
+        ttk.Label(risk_frame, text="\n".join(messages), justify=tk.LEFT,
+                  style="SecurityRisk.TLabel").pack(anchor=tk.W)
     
     def _create_buttons(self, parent: ttk.Frame):
         """Create dialog buttons."""
@@ -214,40 +274,69 @@ class SecurityConfirmationDialog:
             cancel_btn.focus_set()  # Default to cancel for dangerous operations
         else:
             confirm_btn.focus_set()
+    
+    def _install_key_bindings(self):
+        """Route Enter and Escape in this dialog through the shared class bindings."""
+        # Class bindings live in the Tcl interpreter, so they are created once
+        if not self.dialog.bind_class(DIALOG_BIND_TAG):
+            self.dialog.bind_class(DIALOG_BIND_TAG, '<Return>', _dispatch_confirm)
+            self.dialog.bind_class(DIALOG_BIND_TAG, '<Escape>', _dispatch_cancel)
         
-        # Bind Enter and Escape keys
-        self.dialog.bind('<Return>', lambda e: self._confirm())
-        self.dialog.bind('<Escape>', lambda e: self._cancel())
+        self.dialog.confirmation_dialog = self
+        widgets = [self.dialog]
+        while widgets:
+            widget = widgets.pop()
+            widget.bindtags((DIALOG_BIND_TAG,) + widget.bindtags())
+            widgets.extend(widget.winfo_children())
     
     def _get_operation_display_name(self) -> str:
         """Get display name for operation type."""
-        display_names = {
-            OperationType.TASK_CREATE: "建立任務",
-            OperationType.TASK_EDIT: "編輯任務",
-            OperationType.TASK_DELETE: "刪除任務",
-            OperationType.TASK_EXECUTE: "執行任務",
-            OperationType.APP_LAUNCH: "啟動應用程式",
-            OperationType.APP_CLOSE: "關閉應用程式",
-            OperationType.WINDOW_CONTROL: "視窗控制",
-            OperationType.CUSTOM_COMMAND: "自訂命令",
-            OperationType.CONFIG_CHANGE: "配置變更",
-            OperationType.SYSTEM_ACCESS: "系統存取"
-        }
-        return display_names.get(self.operation_type, self.operation_type.value)
+        return OPERATION_DISPLAY_NAMES.get(self.operation_type, self.operation_type.value)
     
     def _confirm(self):
         """Handle confirm button click."""
-        self.result = True
-        self.dialog.destroy()
+        self._finish(True)
     
     def _cancel(self):
         """Handle cancel button click."""
-        self.result = False
+        self._finish(False)
+    
+    def _finish(self, result: bool):
+        """Record the user's choice, resolve the future and close the dialog."""
+        self.result = result
+        if not self._future.done():
+            self._future.set_result(result)
         self.dialog.destroy()
     
     def get_result(self) -> bool:
-        """Get the dialog result."""
-        return self.result
+        """
+        Get the dialog result, waiting for the user's choice if needed.
+        
+        Returns:
+            True if user confirms, False otherwise
+        """
+        return self.wait()
+
+
+def _dialog_for_event(event: tk.Event) -> Optional[SecurityConfirmationDialog]:
+    """Get the confirmation dialog owning the widget that received an event."""
+    return getattr(event.widget.winfo_toplevel(), 'confirmation_dialog', None)
+
+
+def _dispatch_confirm(event: tk.Event):
+    """Confirm the dialog that received an Enter key press."""
+    dialog = _dialog_for_event(event)
+    if dialog:
+        dialog._confirm()
+    return "break"
+
+
+def _dispatch_cancel(event: tk.Event):
+    """Cancel the dialog that received an Escape key press."""
+    dialog = _dialog_for_event(event)
+    if dialog:
+        dialog._cancel()
+    return "break"
 
 
 def show_security_confirmation(parent: tk.Widget, operation_type: OperationType,
@@ -268,7 +357,7 @@ def show_security_confirmation(parent: tk.Widget, operation_type: OperationType,
     """
     try:
         dialog = SecurityConfirmationDialog(parent, operation_type, target, parameters, security_level)
-        return dialog.get_result()
+        return dialog.wait()
     except Exception:
         # Fallback to simple message box if dialog fails
         return messagebox.askyesno(
@@ -0,0 +1,37 @@
+"""
+Named fonts shared by the application pages.
+"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+
+
+# Font names, usable anywhere a Tk font is accepted
+PAGE_TITLE_FONT = "PageTitleFont"
+PAGE_HEADING_FONT = "PageHeadingFont"
+
+# Font name -> font options
+NAMED_FONTS = {
+    PAGE_TITLE_FONT: {"family": "Segoe UI", "size": 18, "weight": "bold"},
+    PAGE_HEADING_FONT: {"family": "Segoe UI", "size": 16, "weight": "bold"},
+}
+
+
+def install_named_fonts(widget: tk.Misc) -> None:
+    """
+    Create the shared named fonts in the widget's Tk interpreter.
+
+    Fonts that already exist are left untouched, so this can be called by
+    every page that uses them.
+
+    Args:
+        widget: Any widget of the target Tk interpreter
+    """
+    existing = set(tkfont.names(widget))
+    for name, options in NAMED_FONTS.items():
+        if name not in existing:
+            # Created through Tcl so the font isn't deleted along with a
+            # garbage-collected tkinter.font.Font wrapper
+            widget.tk.call("font", "create", name,
+                           *(arg for key, value in options.items()
+                             for arg in (f"-{key}", value)))
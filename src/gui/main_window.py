@@ -3,20 +3,115 @@ Main window implementation for Windows Scheduler GUI.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+import os
+import platform
 import sys
+import threading
+from datetime import datetime, timedelta
+from functools import partial
 from typing import Optional, Callable
+import psutil
 from src.models.config import AppConfig
 from src.utils.constants import (
     APP_NAME, APP_VERSION,
     MAIN_WINDOW_MIN_WIDTH, MAIN_WINDOW_MIN_HEIGHT,
-    MAIN_WINDOW_DEFAULT_WIDTH, MAIN_WINDOW_DEFAULT_HEIGHT
+    MAIN_WINDOW_MAX_WIDTH, MAIN_WINDOW_MAX_HEIGHT,
+    MAIN_WINDOW_DEFAULT_WIDTH, MAIN_WINDOW_DEFAULT_HEIGHT,
+    MAIN_WINDOW_RESIZE_DEBOUNCE_MS, MAIN_WINDOW_RESIZE_DEBOUNCE_FAST_MS,
+    MAIN_WINDOW_FAST_CPU_COUNT, ASSETS_DIR, APP_ICON_FILE
 )
 from src.gui.navigation import NavigationFrame
 from src.gui.page_manager import PageManager
+from src.gui.trigger import DebouncedTrigger
+from src.gui.dialogs.schedule_dialog import ScheduleDialog
 from src.gui.pages import OverviewPage, SchedulesPage, ScheduleDetailPage, LogsPage, SettingsPage, HelpPage
 from src.core.task_manager import TaskManager
+from src.core.config_manager import get_config_manager
 from src.storage.task_storage import TaskStorage
+from src.storage.log_storage import get_log_storage
+
+
+# Menu bar layout: (menu label, entries), where each entry is
+# (item label, handler method name) or None for a separator
+MENU_SPEC = (
+    ("檔案", (
+        ("新增任務", "_on_new_task"),
+        ("匯入設定", "_on_import_config"),
+        ("匯出設定", "_on_export_config"),
+        None,
+        ("結束", "_on_exit"),
+    )),
+    ("編輯", (
+        ("偏好設定", "_on_preferences"),
+    )),
+    ("檢視", (
+        ("重新整理", "_on_refresh"),
+        ("全螢幕", "_on_toggle_fullscreen"),
+    )),
+    ("工具", (
+        ("系統資訊", "_on_system_info"),
+        ("清理日誌", "_on_clean_logs"),
+    )),
+    ("說明", (
+        ("使用說明", "_on_help"),
+        ("關於", "_on_about"),
+    )),
+)
+
+
+# Keyboard shortcuts: (event sequence, handler method name)
+SHORTCUTS = (
+    ("<Control-n>", "_on_new_task"),
+    ("<Control-q>", "_on_exit"),
+    ("<F5>", "_on_refresh"),
+    ("<F11>", "_on_toggle_fullscreen"),
+)
+
+# System information dialog text
+SYSTEM_INFO_TEMPLATE = """{app} v{version}
+
+系統資訊:
+作業系統: {os}
+處理器: {processor}
+Python版本: {python}
+記憶體使用: {memory:.1f}%
+磁碟使用: {disk:.1f}%
+
+應用程式狀態:
+任務數量: {task_count}
+當前頁面: {page}"""
+
+# System information text when psutil queries fail
+BASIC_SYSTEM_INFO_TEMPLATE = """{app} v{version}
+
+基本資訊:
+作業系統: {os}
+Python版本: {python}
+任務數量: {task_count}
+當前頁面: {page}"""
+
+# Bind tag carried only by the root window, so child <Configure> events
+# never reach the resize handler
+MAIN_WINDOW_BIND_TAG = "MainWindow"
+
+# Status bar message width in characters
+STATUS_BAR_TEXT_WIDTH = 80
+
+
+def _resize_debounce_ms() -> int:
+    """
+    Get the resize debounce delay for this machine.
+    
+    Fast machines relayout about once per frame so the navigation follows
+    the drag; slower ones wait for the resize to settle.
+    
+    Returns:
+        Debounce delay in milliseconds
+    """
+    if (os.cpu_count() or 1) > MAIN_WINDOW_FAST_CPU_COUNT:
+        return MAIN_WINDOW_RESIZE_DEBOUNCE_FAST_MS
+    return MAIN_WINDOW_RESIZE_DEBOUNCE_MS
 
 
 class MainWindow:
@@ -31,10 +126,22 @@ class MainWindow:
         """
         self.config = config or AppConfig.get_default()
         self.root = tk.Tk()
+        # Keep the window unmapped while it is built, so it is laid out and
+        # painted once when shown rather than after every construction step
+        self.root.withdraw()
+        self._resize_trigger = DebouncedTrigger(self.root, self._apply_responsive_layout,
+                                                _resize_debounce_ms())
+        self._last_window_size = (-1, -1)
+        self._icon_image: Optional[tk.PhotoImage] = None
+        
+        # Status bar labels
+        self.status_label: Optional[ttk.Label] = None
+        self.connection_label: Optional[ttk.Label] = None
         
         # Navigation and page management
         self.navigation_frame: Optional[NavigationFrame] = None
         self.page_manager: Optional[PageManager] = None
+        self._pages_initialized = False
         
         # Core components
         self.task_storage = TaskStorage()
@@ -49,19 +156,35 @@ class MainWindow:
         # Bind events
         self._bind_events()
         
+        # Show the fully built window maximized
+        self.root.state('zoomed')
+        
     def _setup_window(self):
         """Setup main window properties."""
         self.root.title(f"{APP_NAME} v{APP_VERSION}")
         self.root.minsize(MAIN_WINDOW_MIN_WIDTH, MAIN_WINDOW_MIN_HEIGHT)
-
-        # Maximize window
-        self.root.state('zoomed')
         
-        # Set window icon (if available)
+        # Size and center the restored window in a single geometry call
+        width = self.config.window_width or MAIN_WINDOW_DEFAULT_WIDTH
+        height = self.config.window_height or MAIN_WINDOW_DEFAULT_HEIGHT
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
+        x = max(0, (screen_width - width) // 2)
+        y = max(0, (screen_height - height) // 2)
+        self.root.geometry(f"{width}x{height}+{x}+{y}")
+        
+        # Decoding the icon image is deferred until the window is shown
+        self.root.after_idle(self._load_icon)
+    
+    def _load_icon(self):
+        """Load the application icon for the main window and its dialogs."""
         try:
-            # You can add an icon file later
-            pass
-        except Exception:
+            # Keep a reference; Tk drops the image once the object is collected
+            self._icon_image = tk.PhotoImage(master=self.root,
+                                             file=os.path.join(ASSETS_DIR, APP_ICON_FILE))
+            self.root.iconphoto(True, self._icon_image)
+        except tk.TclError:
+            # Missing or unreadable icon; keep the default Tk icon
             pass
     
     def _create_menu_bar(self):
@@ -69,37 +192,15 @@ class MainWindow:
         self.menu_bar = tk.Menu(self.root)
         self.root.config(menu=self.menu_bar)
         
-        # File menu
-        file_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="檔案", menu=file_menu)
-        file_menu.add_command(label="新增任務", command=self._on_new_task)
-        file_menu.add_command(label="匯入設定", command=self._on_import_config)
-        file_menu.add_command(label="匯出設定", command=self._on_export_config)
-        file_menu.add_separator()
-        file_menu.add_command(label="結束", command=self._on_exit)
-        
-        # Edit menu
-        edit_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="編輯", menu=edit_menu)
-        edit_menu.add_command(label="偏好設定", command=self._on_preferences)
-        
-        # View menu
-        view_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="檢視", menu=view_menu)
-        view_menu.add_command(label="重新整理", command=self._on_refresh)
-        view_menu.add_command(label="全螢幕", command=self._on_toggle_fullscreen)
-        
-        # Tools menu
-        tools_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="工具", menu=tools_menu)
-        tools_menu.add_command(label="系統資訊", command=self._on_system_info)
-        tools_menu.add_command(label="清理日誌", command=self._on_clean_logs)
-        
-        # Help menu
-        help_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="說明", menu=help_menu)
-        help_menu.add_command(label="使用說明", command=self._on_help)
-        help_menu.add_command(label="關於", command=self._on_about)
+        for menu_label, entries in MENU_SPEC:
+            menu = tk.Menu(self.menu_bar, tearoff=0)
+            self.menu_bar.add_cascade(label=menu_label, menu=menu)
+            for entry in entries:
+                if entry is None:
+                    menu.add_separator()
+                else:
+                    label, handler_name = entry
+                    menu.add_command(label=label, command=getattr(self, handler_name))
     
     def _create_main_layout(self):
         """Create the main layout with navigation and content area."""
@@ -124,18 +225,20 @@ class MainWindow:
     
     def _initialize_pages(self):
         """Initialize all application pages."""
-        if not self.page_manager:
+        if not self.page_manager or self._pages_initialized:
             return
         
-        # Register all pages
+        # The default page is created now; the rest on first navigation
         self.page_manager.register_page(OverviewPage)
         # Register SchedulesPage with task_manager parameter
-        self.page_manager.register_page(SchedulesPage, task_manager=self.task_manager)
+        self.page_manager.register_lazy_page("Schedules", SchedulesPage, task_manager=self.task_manager)
         # Register ScheduleDetailPage with task_manager parameter
-        self.page_manager.register_page(ScheduleDetailPage, task_manager=self.task_manager)
-        self.page_manager.register_page(LogsPage, page_manager=self.page_manager)
-        self.page_manager.register_page(SettingsPage)
-        self.page_manager.register_page(HelpPage)
+        self.page_manager.register_lazy_page("ScheduleDetail", ScheduleDetailPage,
+                                             task_manager=self.task_manager)
+        self.page_manager.register_lazy_page("Logs", LogsPage, page_manager=self.page_manager)
+        self.page_manager.register_lazy_page("Settings", SettingsPage)
+        self.page_manager.register_lazy_page("Help", HelpPage)
+        self._pages_initialized = True
     
     def _switch_to_default_page(self):
         """Switch to the default page."""
@@ -151,64 +254,110 @@ class MainWindow:
             page_id: ID of the page to switch to
         """
         if self.page_manager:
+            # Re-selecting the shown page would only leave and re-enter it
+            if page_id == self.page_manager.get_current_page():
+                self.set_status(f"當前頁面: {page_id}")
+                return
+            
             success = self.page_manager.switch_to_page(page_id)
             if success:
                 self.set_status(f"當前頁面: {page_id}")
             else:
                 self.set_status(f"無法切換到頁面: {page_id}")
     
-    
-    
-    
     def _create_status_bar(self):
         """Create the status bar."""
         self.status_bar = ttk.Frame(self.root)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # Status text
-        self.status_text = tk.StringVar()
-        self.status_text.set("就緒")
-        
-        status_label = ttk.Label(self.status_bar, textvariable=self.status_text)
-        status_label.pack(side=tk.LEFT, padx=5, pady=2)
+        # Status text; a fixed width keeps text changes from resizing the bar
+        self.status_label = ttk.Label(self.status_bar, text="就緒",
+                                      width=STATUS_BAR_TEXT_WIDTH, anchor=tk.W)
+        self.status_label.pack(side=tk.LEFT, padx=5, pady=2)
         
         # Separator
         separator = ttk.Separator(self.status_bar, orient=tk.VERTICAL)
         separator.pack(side=tk.LEFT, fill=tk.Y, padx=5)
         
-        # Connection status
-        self.connection_status = tk.StringVar()
-        self.connection_status.set("Windows-MCP: 已連接")
-        
-        connection_label = ttk.Label(self.status_bar, textvariable=self.connection_status)
-        connection_label.pack(side=tk.LEFT, padx=5, pady=2)
-    
+        # Connection status; the fixed prefix has its own label so updates
+        # only replace the status word
+        connection_prefix = ttk.Label(self.status_bar, text="Windows-MCP:")
+        connection_prefix.pack(side=tk.LEFT, padx=(5, 0), pady=2)
+        self.connection_label = ttk.Label(self.status_bar, text="已連接")
+        self.connection_label.pack(side=tk.LEFT, padx=(2, 5), pady=2)
     
     def _bind_events(self):
         """Bind window events."""
         self.root.protocol("WM_DELETE_WINDOW", self._on_window_close)
         
         # Keyboard shortcuts
-        self.root.bind("<Control-n>", lambda e: self._on_new_task())
-        self.root.bind("<Control-q>", lambda e: self._on_exit())
-        self.root.bind("<F5>", lambda e: self._on_refresh())
-        self.root.bind("<F11>", lambda e: self._on_toggle_fullscreen())
+        for sequence, handler_name in SHORTCUTS:
+            self.root.bind(sequence, partial(self._on_shortcut, handler_name))
         
-        # Window resize event for responsive layout
-        self.root.bind("<Configure>", self._on_window_configure)
+        # Window resize event for responsive layout. Bindings on the root
+        # also run for every child widget, since all of them carry the
+        # toplevel's tag; a tag of its own keeps this to the window itself
+        self.root.bindtags((MAIN_WINDOW_BIND_TAG,) + self.root.bindtags())
+        self.root.bind_class(MAIN_WINDOW_BIND_TAG, "<Configure>", self._on_window_configure)
+    
+    def _on_shortcut(self, handler_name: str, event=None):
+        """
+        Run the handler for a keyboard shortcut.
+        
+        The handler is looked up on each key press, so handlers replaced on
+        the instance (such as SchedulerApp's exit hook) are honoured.
+        
+        Args:
+            handler_name: Name of the handler method
+            event: Key event
+        """
+        getattr(self, handler_name)()
+        return "break"
     
     def _on_window_configure(self, event):
         """Handle window resize for responsive layout."""
-        if event.widget == self.root and self.navigation_frame:
-            # Update navigation layout based on window width
-            window_width = self.root.winfo_width()
-            window_height = self.root.winfo_height()
-            
-            # Configure responsive layout
+        if not self.navigation_frame:
+            return
+        
+        # <Configure> also fires when the window only moves; the layout
+        # depends on size alone
+        size = (event.width, event.height)
+        if size == self._last_window_size:
+            return
+        self._last_window_size = size
+        
+        # <Configure> fires continuously while dragging; relayout once it settles
+        self._resize_trigger()
+    
+    def _apply_responsive_layout(self):
+        """Update the navigation layout for the current window width."""
+        window_width = self.root.winfo_width()
+        self._capture_window_metrics(window_width)
+        
+        if self.navigation_frame:
             self.navigation_frame.configure_responsive_layout(window_width)
             
             # Note: PageManager doesn't need layout updates as it uses pack with expand=True
     
+    def _capture_window_metrics(self, window_width: int):
+        """
+        Record the restored window size in the configuration.
+        
+        Runs after each settled resize, so exiting doesn't have to query the
+        window. Maximized and fullscreen sizes are not restore sizes and are
+        skipped. Sizes are clamped to the range AppConfig accepts, since a
+        window spanning several monitors can be larger.
+        
+        Args:
+            window_width: Current window width
+        """
+        if self.root.state() != 'normal' or self.root.attributes("-fullscreen"):
+            return
+        self.config.window_width = min(max(window_width, MAIN_WINDOW_MIN_WIDTH),
+                                       MAIN_WINDOW_MAX_WIDTH)
+        self.config.window_height = min(max(self.root.winfo_height(), MAIN_WINDOW_MIN_HEIGHT),
+                                        MAIN_WINDOW_MAX_HEIGHT)
+    
     def _on_window_close(self):
         """Handle window close event."""
         if self.config.minimize_to_tray:
@@ -220,8 +369,6 @@ class MainWindow:
     def _on_new_task(self):
         """Handle new task creation."""
         try:
-            from src.gui.dialogs.schedule_dialog import ScheduleDialog
-            
             # Create and show the schedule dialog
             dialog = ScheduleDialog(self.root, on_save=self._on_task_saved_from_menu)
             result = dialog.show()
@@ -253,10 +400,6 @@ class MainWindow:
     def _on_import_config(self):
         """Handle configuration import."""
         try:
-            from tkinter import filedialog
-            from src.core.config_manager import get_config_manager
-            import json
-            
             # Ask user to select config file
             file_path = filedialog.askopenfilename(
                 title="選擇設定檔案",
@@ -266,15 +409,12 @@ class MainWindow:
             if file_path:
                 config_manager = get_config_manager()
                 
-                # Load and validate config file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
-                
-                # Import configuration
-                config_manager.import_config(config_data)
-                
-                messagebox.showinfo("匯入成功", "設定已成功匯入")
-                self.set_status("設定匯入完成")
+                # Import runs on the UI thread: it notifies configuration
+                # observers, and the settings page reloads its widgets
+                if config_manager.import_config(file_path):
+                    self.set_status("設定已成功匯入")
+                else:
+                    messagebox.showerror("匯入失敗", "無法匯入設定，請確認檔案格式")
                 
         except Exception as e:
             messagebox.showerror("匯入失敗", f"無法匯入設定:\n{str(e)}")
@@ -282,34 +422,42 @@ class MainWindow:
     def _on_export_config(self):
         """Handle configuration export."""
         try:
-            from tkinter import filedialog
-            from src.core.config_manager import get_config_manager
-            import json
-            from datetime import datetime
-            
             # Ask user where to save config file
             file_path = filedialog.asksaveasfilename(
                 title="儲存設定檔案",
                 defaultextension=".json",
                 filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
-                initialname=f"scheduler_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                initialfile=f"scheduler_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             )
             
             if file_path:
                 config_manager = get_config_manager()
+                self.set_status("正在匯出設定...")
                 
-                # Export configuration
-                config_data = config_manager.export_config()
+                # Write the file off the UI thread
+                def export():
+                    success = config_manager.export_config(file_path)
+                    self.root.after(0, lambda: self._on_export_finished(success, file_path))
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(config_data, f, indent=2, ensure_ascii=False)
-                
-                messagebox.showinfo("匯出成功", f"設定已匯出至:\n{file_path}")
-                self.set_status("設定匯出完成")
+                threading.Thread(target=export, daemon=True).start()
                 
         except Exception as e:
             messagebox.showerror("匯出失敗", f"無法匯出設定:\n{str(e)}")
     
+    def _on_export_finished(self, success: bool, file_path: str):
+        """
+        Report a background configuration export on the UI thread.
+        
+        Args:
+            success: Whether the export succeeded
+            file_path: Export file path
+        """
+        if success:
+            self.set_status(f"設定已匯出至: {file_path}")
+        else:
+            self.set_status("就緒")
+            messagebox.showerror("匯出失敗", f"無法匯出設定至:\n{file_path}")
+    
     def _on_preferences(self):
         """Handle preferences dialog."""
         # Switch to settings page
@@ -318,13 +466,9 @@ class MainWindow:
     
     def _on_refresh(self):
         """Handle refresh action."""
-        self.set_status("正在重新整理...")
-        
-        # Refresh current page content
+        # Pages refresh synchronously, so completion is known on return
         self.refresh_current_page()
-        
-        # Update status after refresh
-        self.root.after(500, lambda: self.set_status("重新整理完成"))
+        self.set_status("重新整理完成")
     
     def _on_toggle_fullscreen(self):
         """Toggle fullscreen mode."""
@@ -333,49 +477,65 @@ class MainWindow:
     
     def _on_system_info(self):
         """Show system information."""
-        try:
-            import platform
-            import psutil
-            from src.utils.constants import APP_NAME, APP_VERSION
-            
-            # Gather system information
-            system_info = f"""
-{APP_NAME} v{APP_VERSION}
-
-系統資訊:
-作業系統: {platform.system()} {platform.release()}
-處理器: {platform.processor()}
-Python版本: {platform.python_version()}
-記憶體使用: {psutil.virtual_memory().percent:.1f}%
-磁碟使用: {psutil.disk_usage('/').percent:.1f}%
-
-應用程式狀態:
-任務數量: {len(self.task_manager.get_all_tasks())}
-當前頁面: {self.get_current_page()}
-            """.strip()
-            
-            messagebox.showinfo("系統資訊", system_info)
+        # Read application state here; platform and psutil queries run off
+        # the UI thread
+        current_page = self.get_current_page()
+        task_count = len(self.task_manager.get_all_tasks())
+        self.set_status("正在收集系統資訊...")
+        
+        def gather():
+            system_info = self._gather_system_info(current_page, task_count)
+            self.root.after(0, lambda: self._show_system_info(system_info))
+        
+        threading.Thread(target=gather, daemon=True).start()
+    
+    def _gather_system_info(self, current_page: str, task_count: int) -> str:
+        """
+        Collect the system information text.
+        
+        Runs on a worker thread, since processor and disk queries can take
+        a noticeable time on Windows.
+        
+        Args:
+            current_page: Current page ID
+            task_count: Number of tasks
             
-        except Exception as e:
-            # Fallback system info without psutil
-            basic_info = f"""
-{APP_NAME} v{APP_VERSION}
-
-基本資訊:
-作業系統: {platform.system()} {platform.release()}
-Python版本: {platform.python_version()}
-任務數量: {len(self.task_manager.get_all_tasks())}
-當前頁面: {self.get_current_page()}
-            """.strip()
+        Returns:
+            System information text
+        """
+        info = {
+            "app": APP_NAME,
+            "version": APP_VERSION,
+            "os": f"{platform.system()} {platform.release()}",
+            "python": platform.python_version(),
+            "task_count": task_count,
+            "page": current_page,
+        }
+        try:
+            return SYSTEM_INFO_TEMPLATE.format(
+                processor=platform.processor(),
+                memory=psutil.virtual_memory().percent,
+                disk=psutil.disk_usage('/').percent,
+                **info
+            )
             
-            messagebox.showinfo("系統資訊", basic_info)
+        except Exception:
+            # Fallback system info when psutil queries fail
+            return BASIC_SYSTEM_INFO_TEMPLATE.format(**info)
+    
+    def _show_system_info(self, system_info: str):
+        """
+        Show gathered system information on the UI thread.
+        
+        Args:
+            system_info: System information text
+        """
+        self.set_status("就緒")
+        messagebox.showinfo("系統資訊", system_info)
     
     def _on_clean_logs(self):
         """Handle log cleanup."""
         try:
-            from src.storage.log_storage import get_log_storage
-            from datetime import datetime, timedelta
-            
             # Ask for confirmation
             result = messagebox.askyesno(
                 "清理日誌", 
@@ -385,30 +545,48 @@ Python版本: {platform.python_version()}
             if result:
                 log_storage = get_log_storage()
                 cutoff_date = datetime.now() - timedelta(days=30)
+                self.set_status("正在清理日誌...")
                 
-                # Clean old logs
-                success = log_storage.delete_logs(cutoff_date)
-                
-                if success:
-                    messagebox.showinfo(
-                        "清理完成", 
-                        f"已清理 {cutoff_date.strftime('%Y-%m-%d')} 之前的日誌"
-                    )
-                    self.set_status("日誌清理完成")
+                # Deleting reloads every log file; run it off the UI thread
+                def clean():
                     try:
-                        if hasattr(self, 'page_manager'):
-                            self.page_manager.refresh_current_page()
-                    except Exception:
-                        pass
-                else:
-                    messagebox.showerror("錯誤", "清理日誌失敗")
+                        success = log_storage.delete_logs(cutoff_date)
+                        self.root.after(0, lambda: self._on_clean_logs_finished(success, cutoff_date))
+                    except Exception as e:
+                        error = str(e)
+                        self.root.after(0, lambda: self._on_clean_logs_finished(False, cutoff_date, error))
+                
+                threading.Thread(target=clean, daemon=True).start()
                 
         except Exception as e:
             messagebox.showerror("錯誤", f"清理日誌時發生錯誤:\n{str(e)}")
     
+    def _on_clean_logs_finished(self, success: bool, cutoff_date, error: Optional[str] = None):
+        """
+        Report a background log cleanup on the UI thread.
+        
+        Args:
+            success: Whether the cleanup succeeded
+            cutoff_date: Logs before this date were deleted
+            error: Error message if the cleanup raised
+        """
+        if success:
+            self.set_status(f"已清理 {cutoff_date.strftime('%Y-%m-%d')} 之前的日誌")
+            try:
+                if self.page_manager:
+                    self.page_manager.refresh_current_page()
+            except Exception:
+                pass
+        else:
+            self.set_status("就緒")
+            if error:
+                messagebox.showerror("錯誤", f"清理日誌時發生錯誤:\n{error}")
+            else:
+                messagebox.showerror("錯誤", "清理日誌失敗")
+    
     def _on_help(self):
         """Show help documentation."""
-        self._switch_page("Help")
+        self.switch_to_page("Help")
     
     def _on_about(self):
         """Show about dialog."""
@@ -427,12 +605,7 @@ Windows應用程式排程控制GUI
     def _on_exit(self):
         """Handle application exit."""
         if messagebox.askokcancel("結束應用程式", "確定要結束應用程式嗎？"):
-            # Save window size and position
-            self.config.window_width = self.root.winfo_width()
-            self.config.window_height = self.root.winfo_height()
-            
-            # TODO: Save configuration
-            
+            # Window size is already recorded by _capture_window_metrics
             self.root.quit()
             sys.exit(0)
     
@@ -447,8 +620,8 @@ Windows應用程式排程控制GUI
         Args:
             message: Status message to display
         """
-        if hasattr(self, 'status_text') and self.status_text:
-            self.status_text.set(message)
+        if self.status_label:
+            self.status_label.configure(text=message)
     
     def set_connection_status(self, status: str):
         """
@@ -457,7 +630,8 @@ Windows應用程式排程控制GUI
         Args:
             status: Connection status message
         """
-        self.connection_status.set(f"Windows-MCP: {status}")
+        if self.connection_label:
+            self.connection_label.configure(text=status)
     
     def get_current_page(self) -> str:
         """
@@ -466,8 +640,10 @@ Windows應用程式排程控制GUI
         Returns:
             Current page ID
         """
-        if self.navigation_frame:
-            return self.navigation_frame.get_current_page() or "Overview"
+        # PageManager also sees switches made by pages directly, such as
+        # SchedulesPage opening ScheduleDetail
+        if self.page_manager:
+            return self.page_manager.get_current_page() or "Overview"
         return "Overview"
     
     def refresh_current_page(self):
@@ -8,6 +8,7 @@ from typing import Dict, Callable, Optional, List, Tuple
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 
 
 class NavigationState(Enum):
@@ -30,6 +31,16 @@ class NavigationItem:
     shortcut: Optional[str] = None
 
 
+# (page ID, display name, description, shortcut) for the default navigation items
+DEFAULT_NAVIGATION_ITEMS = (
+    ("Overview", "系統概覽", "顯示系統狀態、任務統計和最近活動", "Ctrl+1"),
+    ("Schedules", "排程管理", "管理排程任務、建立和編輯排程", "Ctrl+2"),
+    ("Logs", "執行記錄", "查看任務執行歷史和日誌", "Ctrl+4"),
+    ("Settings", "系統設定", "配置應用程式設定和偏好", "Ctrl+5"),
+    ("Help", "說明文件", "使用指南、FAQ和支援資訊", "F1"),
+)
+
+
 class PageInterface(ABC):
     """Interface for navigation pages."""
     
@@ -79,8 +90,10 @@ class NavigationFrame:
         self.current_page: Optional[str] = None
         self.navigation_items: Dict[str, NavigationItem] = {}
         self.navigation_buttons: Dict[str, ttk.Button] = {}
+        self._button_appearance: Dict[str, Tuple[str, str]] = {}
         self.page_history: List[str] = []
         self.max_history_size = 10
+        self._layout_band: Optional[str] = None
         
         # UI components
         self.nav_frame: Optional[ttk.Frame] = None
@@ -88,7 +101,7 @@ class NavigationFrame:
         self.buttons_frame: Optional[ttk.Frame] = None
         
         # Style configuration
-        self.style = ttk.Style()
+        self.style = ttk.Style(parent)
         self._configure_styles()
         
         # Create navigation UI
@@ -98,7 +111,12 @@ class NavigationFrame:
         self._initialize_default_items()
     
     def _configure_styles(self):
-        """Configure navigation button styles."""
+        """Configure navigation button styles once per Tk interpreter."""
+        # Styles are interpreter-wide; a later navigation frame reuses them
+        # (and whatever responsive sizing is currently applied)
+        if self.style.lookup("NavigationActive.TButton", "foreground"):
+            return
+        
         # Normal navigation button
         self.style.configure(
             "Navigation.TButton",
@@ -166,41 +184,23 @@ class NavigationFrame:
     
     def _initialize_default_items(self):
         """Initialize default navigation items."""
-        default_items = [
-            NavigationItem(
-                page_id="Overview",
-                display_name="系統概覽",
-                description="顯示系統狀態、任務統計和最近活動",
-                shortcut="Ctrl+1"
-            ),
-            NavigationItem(
-                page_id="Schedules",
-                display_name="排程管理",
-                description="管理排程任務、建立和編輯排程",
-                shortcut="Ctrl+2"
-            ),
-            NavigationItem(
-                page_id="Logs",
-                display_name="執行記錄",
-                description="查看任務執行歷史和日誌",
-                shortcut="Ctrl+4"
-            ),
-            NavigationItem(
-                page_id="Settings",
-                display_name="系統設定",
-                description="配置應用程式設定和偏好",
-                shortcut="Ctrl+5"
-            ),
-            NavigationItem(
-                page_id="Help",
-                display_name="說明文件",
-                description="使用指南、FAQ和支援資訊",
-                shortcut="F1"
+        # Items are mutable, so each frame builds its own from the table
+        buttons = []
+        for page_id, display_name, description, shortcut in DEFAULT_NAVIGATION_ITEMS:
+            item = NavigationItem(
+                page_id=page_id,
+                display_name=display_name,
+                description=description,
+                shortcut=shortcut
             )
-        ]
-        
-        for item in default_items:
-            self.add_navigation_item(item)
+            self.navigation_items[page_id] = item
+            button = self._create_navigation_button(item, pack=False)
+            if button:
+                buttons.append(button)
+        
+        # Pack all default buttons with one geometry manager call
+        if buttons:
+            self.buttons_frame.tk.call("pack", *buttons, "-side", tk.LEFT, "-padx", (8, 0))
     
     def add_navigation_item(self, item: NavigationItem):
         """
@@ -226,6 +226,7 @@ class NavigationFrame:
             if page_id in self.navigation_buttons:
                 self.navigation_buttons[page_id].destroy()
                 del self.navigation_buttons[page_id]
+                self._button_appearance.pop(page_id, None)
             
             # Remove from items
             del self.navigation_items[page_id]
@@ -237,26 +238,33 @@ class NavigationFrame:
                 if available_pages:
                     self.switch_to_page(available_pages[0])
     
-    def _create_navigation_button(self, item: NavigationItem):
+    def _create_navigation_button(self, item: NavigationItem,
+                                  pack: bool = True) -> Optional[ttk.Button]:
         """
         Create a navigation button for the item.
         
         Args:
             item: Navigation item
+            pack: Pack the button now; callers creating several buttons
+                may pack them together instead
+            
+        Returns:
+            The created button, or None if the navigation UI is missing
         """
         if not self.buttons_frame:
-            return
+            return None
         
         # Create button
         button = ttk.Button(
             self.buttons_frame,
             text=item.display_name,
-            command=lambda: self.switch_to_page(item.page_id),
+            command=partial(self.switch_to_page, item.page_id),
             style="Navigation.TButton"
         )
         
         # Pack button
-        button.pack(side=tk.LEFT, padx=(8, 0))
+        if pack:
+            button.pack(side=tk.LEFT, padx=(8, 0))
         
         # Store button reference
         self.navigation_buttons[item.page_id] = button
@@ -268,6 +276,8 @@ class NavigationFrame:
         # Bind keyboard shortcut
         if item.shortcut:
             self._bind_shortcut(item.shortcut, item.page_id)
+        
+        return button
     
     def _add_tooltip(self, widget: tk.Widget, text: str):
         """
@@ -348,8 +358,9 @@ class NavigationFrame:
         # Update current page
         self.current_page = page_id
         
-        # Update button styles
-        self._update_button_styles()
+        # Only the previously and newly active buttons change appearance
+        self._update_button_style(previous_page)
+        self._update_button_style(page_id)
         
         # Call page change callback
         if self.on_page_change:
@@ -388,18 +399,34 @@ class NavigationFrame:
     
     def _update_button_styles(self):
         """Update navigation button styles based on current state."""
-        for page_id, button in self.navigation_buttons.items():
-            item = self.navigation_items[page_id]
-            
-            if not item.enabled:
-                button.configure(style="NavigationDisabled.TButton")
-                button.configure(state="disabled")
-            elif page_id == self.current_page:
-                button.configure(style="NavigationActive.TButton")
-                button.configure(state="normal")
-            else:
-                button.configure(style="Navigation.TButton")
-                button.configure(state="normal")
+        for page_id in self.navigation_buttons:
+            self._update_button_style(page_id)
+    
+    def _update_button_style(self, page_id: Optional[str]):
+        """
+        Update one navigation button's style based on current state.
+        
+        Args:
+            page_id: Page ID of the button; ignored if it has no button
+        """
+        button = self.navigation_buttons.get(page_id)
+        if button is None:
+            return
+        item = self.navigation_items[page_id]
+        
+        if not item.enabled:
+            appearance = ("NavigationDisabled.TButton", "disabled")
+        elif page_id == self.current_page:
+            appearance = ("NavigationActive.TButton", "normal")
+        else:
+            appearance = ("Navigation.TButton", "normal")
+        
+        # Reconfiguring redraws the button, so skip it when nothing changed
+        if self._button_appearance.get(page_id) == appearance:
+            return
+        style, state = appearance
+        button.configure(style=style, state=state)
+        self._button_appearance[page_id] = appearance
     
     def set_page_enabled(self, page_id: str, enabled: bool):
         """
@@ -439,6 +466,7 @@ class NavigationFrame:
                 # Remove button if it exists
                 self.navigation_buttons[page_id].destroy()
                 del self.navigation_buttons[page_id]
+                self._button_appearance.pop(page_id, None)
                 
                 # Switch away from hidden page
                 if self.current_page == page_id:
@@ -516,8 +544,19 @@ class NavigationFrame:
         Args:
             window_width: Current window width
         """
-        # Adjust button padding and font size based on window width
+        # Styles only change when the width crosses into another band
         if window_width < 800:
+            band = "compact"
+        elif window_width < 1200:
+            band = "medium"
+        else:
+            band = "full"
+        if band == self._layout_band:
+            return
+        self._layout_band = band
+        
+        # Adjust button padding and font size based on window width
+        if band == "compact":
             # Compact layout for small windows
             self.style.configure(
                 "Navigation.TButton",
@@ -529,7 +568,7 @@ class NavigationFrame:
                 padding=(8, 6),
                 font=("Segoe UI", 9, "bold")
             )
-        elif window_width < 1200:
+        elif band == "medium":
             # Medium layout
             self.style.configure(
                 "Navigation.TButton",
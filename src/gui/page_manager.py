@@ -4,10 +4,11 @@ Page management system for the Windows Scheduler GUI.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Optional, Type, Any
+from typing import Dict, Optional, Type, Any, Tuple
 from abc import ABC, abstractmethod
 
 from src.gui.navigation import PageInterface
+from src.gui.fonts import install_named_fonts
 
 
 class BasePage(PageInterface):
@@ -35,6 +36,7 @@ class BasePage(PageInterface):
     def _create_frame(self):
         """Create the main page frame."""
         self.frame = ttk.Frame(self.parent)
+        install_named_fonts(self.frame)
         # Don't pack yet - will be managed by PageManager
     
     def get_page_id(self) -> str:
@@ -100,6 +102,9 @@ class PageManager:
         self.pages: Dict[str, BasePage] = {}
         self.current_page: Optional[str] = None
         
+        # Pages registered lazily, created on first use
+        self._page_factories: Dict[str, Tuple[Type[BasePage], tuple, dict]] = {}
+        
         # Create container frame
         self.container = ttk.Frame(parent)
         self.container.pack(fill=tk.BOTH, expand=True)
@@ -115,16 +120,89 @@ class PageManager:
             
         Returns:
             Page ID of the registered page
+            
+        Raises:
+            ValueError: If the page class or its page ID is already registered
         """
+        if self._is_class_registered(page_class):
+            raise ValueError(f"{page_class.__name__} is already registered")
+        
         # Create page instance
         page = page_class(self.container, *args, **kwargs)
         page_id = page.get_page_id()
+        if page_id in self.pages or page_id in self._page_factories:
+            page.frame.destroy()
+            raise ValueError(f"Page ID '{page_id}' is already registered")
         
         # Store page
         self.pages[page_id] = page
         
         return page_id
     
+    def register_lazy_page(self, page_id: str, page_class: Type[BasePage],
+                           *args, **kwargs) -> str:
+        """
+        Register a page that is created the first time it is needed.
+        
+        Args:
+            page_id: Page ID the page class reports
+            page_class: Page class to instantiate
+            *args: Arguments for page constructor
+            **kwargs: Keyword arguments for page constructor
+            
+        Returns:
+            Page ID of the registered page
+            
+        Raises:
+            ValueError: If the page class or page ID is already registered
+        """
+        if page_id in self.pages or page_id in self._page_factories:
+            raise ValueError(f"Page ID '{page_id}' is already registered")
+        if self._is_class_registered(page_class):
+            raise ValueError(f"{page_class.__name__} is already registered")
+        
+        self._page_factories[page_id] = (page_class, args, kwargs)
+        return page_id
+    
+    def _is_class_registered(self, page_class: Type[BasePage]) -> bool:
+        """
+        Check whether a page class is already registered, created or not.
+        
+        Args:
+            page_class: Page class
+            
+        Returns:
+            True if an instance or lazy registration of the class exists
+        """
+        return (any(type(page) is page_class for page in self.pages.values()) or
+                any(factory[0] is page_class for factory in self._page_factories.values()))
+    
+    def _ensure_page(self, page_id: str) -> Optional[BasePage]:
+        """
+        Get a page instance, creating a lazily registered page if needed.
+        
+        Args:
+            page_id: Page ID
+            
+        Returns:
+            Page instance or None if no such page is registered
+        """
+        page = self.pages.get(page_id)
+        if page is not None:
+            return page
+        
+        factory = self._page_factories.pop(page_id, None)
+        if factory is None:
+            return None
+        
+        page_class, args, kwargs = factory
+        page = page_class(self.container, *args, **kwargs)
+        if page.get_page_id() != page_id:
+            raise ValueError(f"{page_class.__name__} reports page ID "
+                             f"'{page.get_page_id()}', expected '{page_id}'")
+        self.pages[page_id] = page
+        return page
+    
     def add_page(self, page: BasePage) -> str:
         """
         Add an existing page instance.
@@ -134,8 +212,13 @@ class PageManager:
             
         Returns:
             Page ID of the added page
+            
+        Raises:
+            ValueError: If the page ID is already registered
         """
         page_id = page.get_page_id()
+        if page_id in self.pages or page_id in self._page_factories:
+            raise ValueError(f"Page ID '{page_id}' is already registered")
         self.pages[page_id] = page
         return page_id
     
@@ -149,6 +232,9 @@ class PageManager:
         Returns:
             True if page was removed
         """
+        if self._page_factories.pop(page_id, None) is not None:
+            return True
+        
         if page_id not in self.pages:
             return False
         
@@ -179,7 +265,8 @@ class PageManager:
         Returns:
             True if switch was successful
         """
-        if page_id not in self.pages:
+        new_page = self._ensure_page(page_id)
+        if new_page is None:
             return False
         
         # Hide current page
@@ -189,7 +276,6 @@ class PageManager:
             current_page.hide()
         
         # Show new page
-        new_page = self.pages[page_id]
         new_page.show()
         new_page.on_page_enter()
         
@@ -215,11 +301,13 @@ class PageManager:
         Returns:
             Page instance or None
         """
-        return self.pages.get(page_id)
+        return self._ensure_page(page_id)
     
     def get_all_pages(self) -> Dict[str, BasePage]:
         """
-        Get all registered pages.
+        Get all created pages.
+        
+        Lazily registered pages that have not been used yet are not included.
         
         Returns:
             Dictionary of page ID to page instance
@@ -260,4 +348,4 @@ class PageManager:
         Returns:
             Number of pages
         """
-        return len(self.pages)
\ No newline at end of file
+        return len(self.pages) + len(self._page_factories)
\ No newline at end of file
@@ -8,6 +8,7 @@ from typing import List, Optional
 import webbrowser
 
 from src.gui.page_manager import BasePage
+from src.gui.fonts import PAGE_TITLE_FONT, PAGE_HEADING_FONT
 from src.storage.help_content_storage import get_help_content_storage
 from src.models.help_models import HelpContent, FAQItem, ContactInfo, SearchResult
 
@@ -32,7 +33,7 @@ class HelpPage(BasePage):
         title_label = ttk.Label(
             self.frame,
             text="Help & Support",
-            font=("Segoe UI", 18, "bold")
+            font=PAGE_TITLE_FONT
         )
         title_label.pack(anchor=tk.W, pady=(0, 10))
         
@@ -145,7 +146,7 @@ class HelpPage(BasePage):
         title_label = ttk.Label(
             contact_container,
             text="聯絡我們",
-            font=("Segoe UI", 16, "bold")
+            font=PAGE_HEADING_FONT
         )
         title_label.pack(anchor=tk.W, pady=(0, 20))
         
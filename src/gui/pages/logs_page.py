@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 import re
 
 from src.gui.page_manager import BasePage
+from src.gui.fonts import PAGE_HEADING_FONT
 from src.storage.log_storage import get_log_storage
 from src.models.execution import ExecutionLog
 
@@ -637,7 +638,7 @@ class ScheduleLogsPage(BasePage):
         title_label = ttk.Label(
             header_frame,
             text="執行記錄",
-            font=("Segoe UI", 16, "bold")
+            font=PAGE_HEADING_FONT
         )
         title_label.pack(side=tk.LEFT)
         
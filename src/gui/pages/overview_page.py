@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 
 from src.gui.page_manager import BasePage
+from src.gui.fonts import PAGE_TITLE_FONT
 from src.models.statistics import SystemStatistics, ActivityItem, SystemStatus
 
 
@@ -76,7 +77,7 @@ class OverviewPage(BasePage):
         title_label = ttk.Label(
             title_frame,
             text="System Overview",
-            font=("Segoe UI", 18, "bold")
+            font=PAGE_TITLE_FONT
         )
         title_label.pack(anchor=tk.W)
         
@@ -7,6 +7,7 @@ from tkinter import ttk
 from typing import List
 
 from src.gui.page_manager import BasePage
+from src.gui.fonts import PAGE_TITLE_FONT
 from src.gui.widgets.task_list_widget import TaskListWidget
 from src.gui.widgets.task_detail_widget import TaskDetailWidget
 from src.gui.widgets.control_buttons_widget import ControlButtonsWidget
@@ -37,7 +38,7 @@ class SchedulesPage(BasePage):
         title_label = ttk.Label(
             self.frame,
             text="Schedule Management",
-            font=("Segoe UI", 18, "bold")
+            font=PAGE_TITLE_FONT
         )
         title_label.grid(row=0, column=0, sticky="w", pady=(0, 10))
         
@@ -7,6 +7,7 @@ from tkinter import ttk, messagebox, filedialog
 from typing import Dict, Any, Optional, List  # Fixed import
 
 from src.gui.page_manager import BasePage
+from src.gui.fonts import PAGE_TITLE_FONT
 from src.core.config_manager import get_config_manager, ConfigObserver
 from src.models.config import AppConfig
 import logging
@@ -38,7 +39,7 @@ class SettingsPage(BasePage, ConfigObserver):
         title_label = ttk.Label(
             self.frame,
             text="Settings",
-            font=("Segoe UI", 18, "bold")
+            font=PAGE_TITLE_FONT
         )
         title_label.pack(anchor=tk.W, pady=(0, 10))
         
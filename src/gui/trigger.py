@@ -0,0 +1,53 @@
+"""
+Debounced callback trigger for Tkinter widgets.
+"""
+
+import tkinter as tk
+from typing import Callable, Optional
+
+
+class DebouncedTrigger:
+    """
+    Coalesce bursts of calls into a single delayed callback.
+
+    Each call restarts one ``after`` timer on the owning widget, so only the
+    last call in a burst runs the callback. Instances are callable with any
+    arguments, which lets them be passed directly as a ``command=``,
+    ``trace_add`` or event binding callback.
+    """
+
+    def __init__(self, widget: tk.Misc, callback: Callable[[], None], delay_ms: int):
+        """
+        Initialize the trigger.
+
+        Args:
+            widget: Widget whose ``after`` queue schedules the callback
+            callback: Function to run once the burst has settled
+            delay_ms: Quiet period in milliseconds before the callback runs
+        """
+        self.widget = widget
+        self.callback = callback
+        self.delay_ms = delay_ms
+        self._after_id: Optional[str] = None
+
+    def __call__(self, *args) -> None:
+        """Schedule the callback, replacing any pending one."""
+        if self._after_id:
+            self.widget.after_cancel(self._after_id)
+        self._after_id = self.widget.after(self.delay_ms, self._fire)
+
+    @property
+    def pending(self) -> bool:
+        """Whether a callback is scheduled but has not run yet."""
+        return self._after_id is not None
+
+    def cancel(self) -> None:
+        """Cancel the pending callback, if any."""
+        if self._after_id:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _fire(self) -> None:
+        """Run the callback from the ``after`` queue."""
+        self._after_id = None
+        self.callback()
@@ -260,14 +260,19 @@ class ActionSequenceWidget(ttk.Frame):
         
         return sequence_config if sequence_config else None
     
-    def get_action_steps(self) -> Optional[List[ActionStep]]:
+    def get_action_steps(self, sequence_config: Optional[List[Dict[str, Any]]] = None) -> Optional[List[ActionStep]]:
         """
         Get ActionStep objects from the current configuration.
         
+        Args:
+            sequence_config: Configuration already read with
+                get_action_sequence_config, to avoid reading the widgets again
+        
         Returns:
             List of ActionStep objects, or None if invalid
         """
-        sequence_config = self.get_action_sequence_config()
+        if sequence_config is None:
+            sequence_config = self.get_action_sequence_config()
         if not sequence_config:
             return None
         
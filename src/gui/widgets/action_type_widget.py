@@ -11,6 +11,14 @@ from pynput import mouse
 from src.models.action import ActionType, validate_action_params
 
 
+# Applications offered in the app name dropdown
+COMMON_APPS = (
+    "notepad", "calculator", "chrome", "firefox", "edge",
+    "explorer", "cmd", "powershell", "winword", "excel",
+    "outlook", "teams", "discord", "spotify", "vlc"
+)
+
+
 class ActionTypeWidget(ttk.Frame):
     """Widget for configuring action types and parameters."""
     
@@ -84,23 +92,22 @@ class ActionTypeWidget(ttk.Frame):
         # Create parameter input frames (initially hidden)
         self._create_parameter_frames()
     
+    def _populate_app_list(self):
+        """Fill the app name dropdown the first time it is opened."""
+        if not self.app_combo.cget("values"):
+            self.app_combo.configure(values=COMMON_APPS)
+    
     def _create_parameter_frames(self):
         """Create parameter input frames for different action types."""
         # App name frame (used by multiple actions)
         self.app_name_frame = ttk.Frame(self.params_frame)
         ttk.Label(self.app_name_frame, text="應用程式名稱:").pack(anchor=tk.W)
         
-        # Common applications list
-        common_apps = [
-            "notepad", "calculator", "chrome", "firefox", "edge",
-            "explorer", "cmd", "powershell", "winword", "excel",
-            "outlook", "teams", "discord", "spotify", "vlc"
-        ]
-        
-        # Use ComboBox instead of Entry to allow both selection and custom input
-        app_combo = ttk.Combobox(self.app_name_frame, textvariable=self.app_name_var, 
-                                values=common_apps, width=37)
-        app_combo.pack(fill=tk.X, pady=(5, 10))
+        # Use ComboBox instead of Entry to allow both selection and custom input;
+        # the app list is filled in the first time the dropdown is opened
+        self.app_combo = ttk.Combobox(self.app_name_frame, textvariable=self.app_name_var,
+                                      postcommand=self._populate_app_list, width=37)
+        self.app_combo.pack(fill=tk.X, pady=(5, 10))
         ttk.Label(self.app_name_frame, text="選擇常用應用程式或輸入自訂應用程式名稱", 
                  font=("", 8), foreground="gray").pack(anchor=tk.W)
         
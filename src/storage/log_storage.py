@@ -8,14 +8,16 @@ import csv
 import os
 import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Callable
 from datetime import datetime, timedelta
 from collections import defaultdict
 import logging
 
 from src.models.execution import ExecutionLog, ExecutionResult
 from src.core.interfaces import ILogStorage
-from src.utils.constants import LOGS_DIR, LOGS_FILE, MAX_LOG_FILE_SIZE, MAX_LOGS_IN_MEMORY
+from src.utils.constants import (
+    LOGS_DIR, LOGS_FILE, MAX_LOG_FILE_SIZE, MAX_LOGS_IN_MEMORY, LOG_EXPORT_PROGRESS_INTERVAL
+)
 
 
 class LogIndex:
@@ -904,6 +906,104 @@ class LogStorage(ILogStorage):
             log_ids = self._index.search(filters)
             return len(log_ids)
     
+    def export_logs(self, logs: List[ExecutionLog], format: str, file_path: str,
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
+        """
+        Export logs to file.
+        
+        Rows are written one log at a time so large exports never build the
+        whole serialized document in memory.
+        
+        Args:
+            logs: List of logs to export
+            format: Export format ('json', 'csv', 'txt')
+            file_path: Output file path
+            progress_callback: Optional callback receiving (written, total)
+                every LOG_EXPORT_PROGRESS_INTERVAL rows and once at the end
+            
+        Returns:
+            True if export was successful
+        """
+        writers = {
+            'json': self._write_json_export,
+            'csv': self._write_csv_export,
+            'txt': self._write_txt_export,
+        }
+        writer = writers.get(format.lower())
+        if writer is None:
+            self.logger.error(f"Unsupported export format: {format}")
+            return False
+        
+        try:
+            newline = '' if writer is self._write_csv_export else None
+            with open(file_path, 'w', encoding='utf-8', newline=newline) as f:
+                total = len(logs)
+                for written in writer(f, logs):
+                    if progress_callback and written % LOG_EXPORT_PROGRESS_INTERVAL == 0:
+                        progress_callback(written, total)
+                if progress_callback:
+                    progress_callback(total, total)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error exporting logs to {format}: {e}")
+            return False
+    
+    def _write_json_export(self, f, logs: List[ExecutionLog]):
+        """Stream logs as a JSON export document, yielding the running row count."""
+        f.write('{\n')
+        f.write(f'  "exported_at": {json.dumps(datetime.now().isoformat())},\n')
+        f.write(f'  "total_logs": {len(logs)},\n')
+        f.write('  "logs": [')
+        for written, log in enumerate(logs, 1):
+            if written > 1:
+                f.write(',')
+            f.write('\n    ')
+            f.write(json.dumps(log.to_dict(), ensure_ascii=False, default=str))
+            yield written
+        f.write('\n  ]\n}\n')
+    
+    def _write_csv_export(self, f, logs: List[ExecutionLog]):
+        """Stream logs as CSV rows, yielding the running row count."""
+        writer = csv.writer(f)
+        writer.writerow([
+            'ID', 'Schedule Name', 'Execution Time', 'Success', 'Operation',
+            'Target', 'Message', 'Duration (s)', 'Retry Count'
+        ])
+        for written, log in enumerate(logs, 1):
+            writer.writerow([
+                log.id,
+                log.schedule_name,
+                log.execution_time.isoformat(),
+                log.result.success,
+                log.result.operation,
+                log.result.target,
+                log.result.message,
+                f"{log.duration.total_seconds():.3f}",
+                log.retry_count
+            ])
+            yield written
+    
+    def _write_txt_export(self, f, logs: List[ExecutionLog]):
+        """Stream logs as a plain-text report, yielding the running row count."""
+        f.write("Execution Logs Export\n")
+        f.write(f"Exported at: {datetime.now().isoformat()}\n")
+        f.write(f"Total logs: {len(logs)}\n")
+        f.write("=" * 50 + "\n\n")
+        for written, log in enumerate(logs, 1):
+            f.write(
+                f"Log ID: {log.id}\n"
+                f"Schedule: {log.schedule_name}\n"
+                f"Time: {log.execution_time.isoformat()}\n"
+                f"Status: {'Success' if log.result.success else 'Failed'}\n"
+                f"Operation: {log.result.operation}\n"
+                f"Target: {log.result.target}\n"
+                f"Message: {log.result.message}\n"
+                f"Duration: {log.duration.total_seconds():.3f}s\n"
+                f"Retries: {log.retry_count}\n"
+                f"{'-' * 50}\n"
+            )
+            yield written
+    
     def backup_logs(self, backup_path: str) -> bool:
         """
         Create a backup of all logs.
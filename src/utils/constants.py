@@ -12,12 +12,14 @@ CONFIG_DIR = ".config"
 DATA_DIR = "data"
 LOGS_DIR = "logs"
 BACKUP_DIR = "backups"
+ASSETS_DIR = "assets"
 
 # File Names
 TASKS_FILE = "tasks.json"
 CONFIG_FILE = "config.json"
 LOGS_FILE = "execution_logs.json"
 HELP_CONTENT_FILE = "help_content.json"
+APP_ICON_FILE = "logo.png"
 
 # Default Settings
 DEFAULT_SCHEDULE_CHECK_FREQUENCY = 1  # seconds
@@ -29,12 +31,18 @@ DEFAULT_LANGUAGE = "zh-TW"
 # GUI Settings
 MAIN_WINDOW_MIN_WIDTH = 800
 MAIN_WINDOW_MIN_HEIGHT = 600
+MAIN_WINDOW_MAX_WIDTH = 3840  # largest size AppConfig.validate accepts
+MAIN_WINDOW_MAX_HEIGHT = 2160
 MAIN_WINDOW_DEFAULT_WIDTH = 1024
 MAIN_WINDOW_DEFAULT_HEIGHT = 768
+MAIN_WINDOW_RESIZE_DEBOUNCE_MS = 80  # quiet period before relayout after a resize
+MAIN_WINDOW_RESIZE_DEBOUNCE_FAST_MS = 16  # about one frame, used on machines with many cores
+MAIN_WINDOW_FAST_CPU_COUNT = 4  # more logical CPUs than this use the fast debounce
 
 # Logging Settings
 MAX_LOG_FILE_SIZE = 100 * 1024 * 1024  # 100MB
 MAX_LOGS_IN_MEMORY = 10000
+LOG_EXPORT_PROGRESS_INTERVAL = 500  # rows between export progress updates
 
 # Task Execution Settings
 MAX_CONCURRENT_TASKS = 5
@@ -2,6 +2,7 @@
 Tests for log storage functionality.
 """
 
+import csv
 import json
 import tempfile
 import unittest
@@ -365,6 +366,66 @@ class TestLogStorage(unittest.TestCase):
         self.assertIn(self.log1.id, content)
         self.assertIn(self.log2.id, content)
     
+    def _create_export_logs(self, count):
+        """Create logs for export tests."""
+        return [
+            ExecutionLog.create_log(
+                f"schedule_{i}",
+                ExecutionResult.success_result("launch_app", "notepad", f"Message, \"{i}\"\nline"),
+                timedelta(seconds=i)
+            )
+            for i in range(count)
+        ]
+    
+    @patch('src.storage.log_storage.LOG_EXPORT_PROGRESS_INTERVAL', 2)
+    def test_export_reports_progress(self):
+        """Test that exports report progress every interval and at the end."""
+        logs = self._create_export_logs(5)
+        
+        for format_type in ("json", "csv", "txt"):
+            with self.subTest(format=format_type):
+                export_path = self.temp_dir + f"/export_progress.{format_type}"
+                progress = []
+                success = self.storage.export_logs(
+                    logs, format_type, export_path,
+                    progress_callback=lambda written, total: progress.append((written, total))
+                )
+                self.assertTrue(success)
+                self.assertEqual(progress, [(2, 5), (4, 5), (5, 5)])
+    
+    def test_export_json_streamed_document(self):
+        """Test that the streamed JSON export is a well-formed document."""
+        logs = self._create_export_logs(3)
+        export_path = self.temp_dir + "/export_streamed.json"
+        self.assertTrue(self.storage.export_logs(logs, "json", export_path))
+        
+        with open(export_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        self.assertEqual(data['total_logs'], 3)
+        self.assertEqual([log['id'] for log in data['logs']], [log.id for log in logs])
+        
+        # Empty exports are well-formed too
+        self.assertTrue(self.storage.export_logs([], "json", export_path))
+        with open(export_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['logs'], [])
+    
+    def test_export_csv_streamed_rows(self):
+        """Test that the streamed CSV export has a header and one row per log."""
+        logs = self._create_export_logs(3)
+        export_path = self.temp_dir + "/export_streamed.csv"
+        self.assertTrue(self.storage.export_logs(logs, "csv", export_path))
+        
+        with open(export_path, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.reader(f))
+        
+        self.assertEqual(rows[0][0], 'ID')
+        self.assertEqual(len(rows), 4)
+        self.assertEqual([row[0] for row in rows[1:]], [log.id for log in logs])
+        # Quoted messages with commas and newlines survive the round trip
+        self.assertEqual(rows[1][6], logs[0].result.message)
+    
     def test_unsupported_export_format(self):
         """Test handling of unsupported export formats."""
         export_path = self.temp_dir + "/export.xyz"
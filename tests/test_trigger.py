@@ -0,0 +1,66 @@
+"""
+Tests for DebouncedTrigger functionality.
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from src.gui.trigger import DebouncedTrigger
+
+
+class FakeWidget:
+    """Minimal stand-in for a widget's after queue."""
+
+    def __init__(self):
+        self.scheduled = {}
+        self._next_id = 0
+
+    def after(self, delay_ms, callback):
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.scheduled[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.scheduled.pop(after_id, None)
+
+    def run_pending(self):
+        callbacks = list(self.scheduled.values())
+        self.scheduled.clear()
+        for callback in callbacks:
+            callback()
+
+
+class TestDebouncedTrigger(unittest.TestCase):
+    """Test cases for DebouncedTrigger class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.widget = FakeWidget()
+        self.callback = Mock()
+        self.trigger = DebouncedTrigger(self.widget, self.callback, 75)
+
+    def test_burst_runs_callback_once(self):
+        """Test that repeated calls coalesce into one callback."""
+        for _ in range(10):
+            self.trigger("ignored", "args")
+
+        self.assertEqual(len(self.widget.scheduled), 1)
+        self.assertTrue(self.trigger.pending)
+
+        self.widget.run_pending()
+        self.callback.assert_called_once_with()
+        self.assertFalse(self.trigger.pending)
+
+    def test_cancel(self):
+        """Test cancelling a pending callback."""
+        self.trigger()
+        self.trigger.cancel()
+
+        self.widget.run_pending()
+        self.callback.assert_not_called()
+        self.assertFalse(self.trigger.pending)
+
+
+if __name__ == '__main__':
+    unittest.main()